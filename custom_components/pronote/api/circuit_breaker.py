@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 import logging
-from datetime import datetime
+import time
+from collections.abc import Callable
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -25,18 +26,21 @@ class CircuitBreaker:
         self,
         failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
         recovery_timeout: int = DEFAULT_RECOVERY_TIMEOUT,
+        clock: Callable[[], float] = time.monotonic,
     ) -> None:
         """Initialize le circuit breaker.
 
         Args:
             failure_threshold: Nombre d'échecs avant ouverture
             recovery_timeout: Temps avant tentative de fermeture (secondes)
+            clock: Horloge monotone en secondes (injectable pour les tests)
         """
         self.failure_threshold = failure_threshold
         self.recovery_timeout = recovery_timeout
         self._failure_count = 0
-        self._last_failure_time: datetime | None = None
+        self._last_failure_time: float | None = None
         self._is_open = False
+        self._clock = clock
 
     @property
     def is_open(self) -> bool:
@@ -49,8 +53,8 @@ class CircuitBreaker:
             return False
 
         # Vérifier si on peut tenter de fermer
-        if self._last_failure_time:
-            elapsed = (datetime.now() - self._last_failure_time).total_seconds()
+        if self._last_failure_time is not None:
+            elapsed = self._clock() - self._last_failure_time
             if elapsed >= self.recovery_timeout:
                 _LOGGER.debug("Circuit breaker: tentative de fermeture après timeout")
                 self._is_open = False
@@ -72,7 +76,7 @@ class CircuitBreaker:
         Si le nombre d'échecs atteint le threshold, le circuit s'ouvre.
         """
         self._failure_count += 1
-        self._last_failure_time = datetime.now()
+        self._last_failure_time = self._clock()
 
         if self._failure_count >= self.failure_threshold:
             _LOGGER.warning(
@@ -565,7 +565,8 @@ class PronoteAPIClient:
 
     # Convertisseurs d'objets pronotepy vers modèles
 
-    def _convert_lesson(self, lesson) -> Lesson:
+    @staticmethod
+    def _convert_lesson(lesson) -> Lesson:
         """Convertit un objet Lesson pronotepy."""
         return Lesson(
             id=str(getattr(lesson, "id", "")),
@@ -581,7 +582,8 @@ class PronoteAPIClient:
             is_detention=getattr(lesson, "detention", False),
         )
 
-    def _convert_grade(self, grade) -> Grade:
+    @staticmethod
+    def _convert_grade(grade) -> Grade:
         """Convertit un objet Grade pronotepy."""
         subject = getattr(grade, "subject", None)
         subject_name = str(subject.name) if subject and hasattr(subject, "name") else str(subject) if subject else ""
@@ -598,7 +600,8 @@ class PronoteAPIClient:
             is_optional=getattr(grade, "is_optionnal", False),
         )
 
-    def _convert_average(self, average) -> Average:
+    @staticmethod
+    def _convert_average(average) -> Average:
         """Convertit un objet Average pronotepy."""
         subject = getattr(average, "subject", None)
         subject_name = str(subject.name) if subject and hasattr(subject, "name") else str(subject) if subject else ""
@@ -610,7 +613,8 @@ class PronoteAPIClient:
             min=str(getattr(average, "min", "")),
         )
 
-    def _convert_absence(self, absence) -> Absence:
+    @staticmethod
+    def _convert_absence(absence) -> Absence:
         """Convertit un objet Absence pronotepy."""
         return Absence(
             id=str(getattr(absence, "id", "")),
@@ -621,7 +625,8 @@ class PronoteAPIClient:
             reason=getattr(absence, "reasons", None),
         )
 
-    def _convert_delay(self, delay) -> Delay:
+    @staticmethod
+    def _convert_delay(delay) -> Delay:
         """Convertit un objet Delay pronotepy."""
         return Delay(
             id=str(getattr(delay, "id", "")),
@@ -631,7 +636,8 @@ class PronoteAPIClient:
             reason=getattr(delay, "reasons", None),
         )
 
-    def _convert_punishment(self, punishment) -> Punishment:
+    @staticmethod
+    def _convert_punishment(punishment) -> Punishment:
         """Convertit un objet Punishment pronotepy."""
         exclusion_dates = getattr(punishment, "exclusion_dates", None)
         reasons = getattr(punishment, "reasons", None)
@@ -647,7 +653,8 @@ class PronoteAPIClient:
             exclusion_dates=list(exclusion_dates) if exclusion_dates else None,
         )
 
-    def _convert_evaluation(self, evaluation) -> Evaluation:
+    @staticmethod
+    def _convert_evaluation(evaluation) -> Evaluation:
         """Convertit un objet Evaluation pronotepy."""
         acquisitions = getattr(evaluation, "acquisitions", None)
         subject = getattr(evaluation, "subject", None)
@@ -660,7 +667,8 @@ class PronoteAPIClient:
             acquisitions=[{"name": a.name, "level": a.level} for a in acquisitions] if acquisitions else None,
         )
 
-    def _convert_homework(self, homework) -> Homework:
+    @staticmethod
+    def _convert_homework(homework) -> Homework:
         """Convertit un objet Homework pronotepy."""
         subject = getattr(homework, "subject", None)
         subject_name = str(subject.name) if subject and hasattr(subject, "name") else str(subject) if subject else None
@@ -674,7 +682,8 @@ class PronoteAPIClient:
             files=getattr(homework, "files", None),
         )
 
-    def _convert_period(self, period) -> PeriodInfo:
+    @staticmethod
+    def _convert_period(period) -> PeriodInfo:
         """Convertit un objet Period pronotepy."""
         return PeriodInfo(
             id=str(getattr(period, "id", "")),
@@ -683,7 +692,8 @@ class PronoteAPIClient:
             end=getattr(period, "end", date.today()),
         )
 
-    def _convert_info_survey(self, info) -> InformationSurvey:
+    @staticmethod
+    def _convert_info_survey(info) -> InformationSurvey:
         """Convertit un objet Information/Survey pronotepy."""
         return InformationSurvey(
             id=str(getattr(info, "id", "")),
@@ -694,7 +704,8 @@ class PronoteAPIClient:
             anonymous_response=getattr(info, "anonymous_response", False),
         )
 
-    def _convert_food_list(self, food_list) -> list[Food] | None:
+    @staticmethod
+    def _convert_food_list(food_list) -> list[Food] | None:
         """Convertit une liste d'aliments pronotepy."""
         if not food_list:
             return None
@@ -713,17 +724,18 @@ class PronoteAPIClient:
             result.append(Food(name=getattr(food, "name", ""), labels=labels))
         return result or None
 
-    def _convert_menu(self, menu) -> Menu:
+    @staticmethod
+    def _convert_menu(menu) -> Menu:
         """Convertit un objet Menu pronotepy."""
         return Menu(
             date=getattr(menu, "date", date.today()),
             name=getattr(menu, "name", None),
             is_lunch=getattr(menu, "is_lunch", False),
             is_dinner=getattr(menu, "is_dinner", False),
-            first_meal=self._convert_food_list(getattr(menu, "first_meal", None)),
-            main_meal=self._convert_food_list(getattr(menu, "main_meal", None)),
-            side_meal=self._convert_food_list(getattr(menu, "side_meal", None)),
-            other_meal=self._convert_food_list(getattr(menu, "other_meal", None)),
-            cheese=self._convert_food_list(getattr(menu, "cheese", None)),
-            dessert=self._convert_food_list(getattr(menu, "dessert", None)),
+            first_meal=PronoteAPIClient._convert_food_list(getattr(menu, "first_meal", None)),
+            main_meal=PronoteAPIClient._convert_food_list(getattr(menu, "main_meal", None)),
+            side_meal=PronoteAPIClient._convert_food_list(getattr(menu, "side_meal", None)),
+            other_meal=PronoteAPIClient._convert_food_list(getattr(menu, "other_meal", None)),
+            cheese=PronoteAPIClient._convert_food_list(getattr(menu, "cheese", None)),
+            dessert=PronoteAPIClient._convert_food_list(getattr(menu, "dessert", None)),
         )
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from datetime import datetime
+import bisect
+from datetime import UTC, datetime, tzinfo
 from zoneinfo import ZoneInfo
 
 from homeassistant.components.calendar import CalendarEntity, CalendarEvent
@@ -10,15 +11,27 @@ from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.util import dt as dt_util
 
-from .const import DOMAIN, PronoteConfigEntry
+from .const import PronoteConfigEntry
 from .coordinator import PronoteDataUpdateCoordinator
 from .entity import PronoteEntity
 from .pronote_formatter import format_displayed_lesson
 
 PARALLEL_UPDATES = 0
 
+_UTC_NAMES = frozenset(("UTC", "Etc/UTC", "Zulu"))
 
-def _ensure_aware(dt: datetime, tz: ZoneInfo) -> datetime:
+
+def _get_zoneinfo(name: str) -> tzinfo:
+    """Return the tzinfo for a timezone name, UTC aliases mapping to the built-in singleton.
+
+    ZoneInfo keeps its own per-name cache, so repeated lookups are cheap.
+    """
+    if name in _UTC_NAMES:
+        return UTC
+    return ZoneInfo(name)
+
+
+def _ensure_aware(dt: datetime, tz: tzinfo) -> datetime:
     """Ensure a datetime is timezone-aware."""
     return dt.replace(tzinfo=tz) if dt.tzinfo is None else dt
 
@@ -35,20 +48,25 @@ async def async_setup_entry(
 
 
 @callback
-def async_get_calendar_event_from_lessons(lesson, timezone) -> CalendarEvent:
+def async_get_calendar_event_from_lessons(lesson, timezone: str) -> CalendarEvent:
     """Get a CalendarEvent from a Pronote Lesson."""
-    tz = ZoneInfo(timezone)
+    tz = _get_zoneinfo(timezone)
+    return _build_event(lesson, _ensure_aware(lesson.start, tz), _ensure_aware(lesson.end, tz))
 
+
+def _build_event(lesson, start: datetime, end: datetime) -> CalendarEvent:
+    """Build the CalendarEvent of a lesson from its already timezone-aware bounds."""
+    room = lesson.room
     lesson_name = format_displayed_lesson(lesson)
     if lesson.canceled:
         lesson_name = f"Annulé - {lesson_name}"
 
     return CalendarEvent(
         summary=lesson_name,
-        description=f"{lesson.teacher} - Salle {lesson.room}",
-        location=f"Salle {lesson.room}" if lesson.room else None,
-        start=_ensure_aware(lesson.start, tz),
-        end=_ensure_aware(lesson.end, tz),
+        description=f"{lesson.teacher} - Salle {room}",
+        location=f"Salle {room}" if room else None,
+        start=start,
+        end=end,
     )
 
 
@@ -70,8 +88,23 @@ class PronoteCalendar(PronoteEntity, CalendarEntity):
 
         self._attr_translation_key = "timetable"
         self._attr_translation_placeholders = {"child": calendar_name}
-        self._attr_unique_id = f"{DOMAIN}_{coordinator.data['sensor_prefix']}_timetable"
+        self._attr_unique_id = coordinator.unique_id_prefix + "timetable"
         self._event: CalendarEvent | None = None
+        # Lesson and timezone the current event was built from, to keep the event while it runs
+        self._event_lesson = None
+        self._event_tz: tzinfo | None = None
+        # Lessons sorted by start, rebuilt whenever the coordinator publishes a new lessons list
+        self._sorted_source: list | None = None
+        self._sorted_tz: tzinfo | None = None
+        self._sorted_lessons: list = []
+        self._sorted_starts: list[datetime] = []
+        self._sorted_ends: list[datetime] = []
+        self._sorted_canceled: list[bool] = []
+
+    @property
+    def _tzinfo(self) -> tzinfo:
+        """Return the current Home Assistant timezone."""
+        return _get_zoneinfo(self.hass.config.time_zone)
 
     @property
     def event(self) -> CalendarEvent | None:
@@ -84,20 +117,38 @@ class PronoteCalendar(PronoteEntity, CalendarEntity):
         lessons = self.coordinator.data.get("lessons_period")
         if not lessons:
             self._event = None
+            self._event_lesson = None
         else:
-            now = dt_util.now()
-            tz = ZoneInfo(self.hass.config.time_zone)
-            try:
-                current_event = next(
-                    event for event in lessons if _ensure_aware(event.start, tz) <= now < _ensure_aware(event.end, tz)
-                )
-            except StopIteration:
+            tz = self._tzinfo
+            now = dt_util.now(tz)
+            current = next(
+                (
+                    lesson
+                    for lesson in lessons
+                    if _ensure_aware(lesson.start, tz) <= now < _ensure_aware(lesson.end, tz)
+                ),
+                None,
+            )
+            if current is None:
                 self._event = None
-            else:
-                self._event = async_get_calendar_event_from_lessons(current_event, self.hass.config.time_zone)
+            elif current is not self._event_lesson or tz != self._event_tz:
+                self._event = async_get_calendar_event_from_lessons(current, self.hass.config.time_zone)
+            self._event_lesson = current
+            self._event_tz = tz
 
         super()._handle_coordinator_update()
 
+    def _refresh_lesson_index(self, lessons: list, tz: tzinfo) -> None:
+        """Rebuild the sorted lesson columns when the lessons list or the timezone changed."""
+        if lessons is self._sorted_source and tz == self._sorted_tz:
+            return
+        self._sorted_lessons = sorted(lessons, key=lambda lesson: _ensure_aware(lesson.start, tz))
+        self._sorted_starts = [_ensure_aware(lesson.start, tz) for lesson in self._sorted_lessons]
+        self._sorted_ends = [_ensure_aware(lesson.end, tz) for lesson in self._sorted_lessons]
+        self._sorted_canceled = [bool(lesson.canceled) for lesson in self._sorted_lessons]
+        self._sorted_source = lessons
+        self._sorted_tz = tz
+
     async def async_get_events(
         self,
         hass: HomeAssistant,
@@ -108,11 +159,17 @@ class PronoteCalendar(PronoteEntity, CalendarEntity):
         lessons = self.coordinator.data.get("lessons_period")
         if not lessons:
             return []
-        tz = ZoneInfo(hass.config.time_zone)
+        tz = self._tzinfo
+        self._refresh_lesson_index(lessons, tz)
+        sorted_lessons, starts, ends, canceled = (
+            self._sorted_lessons,
+            self._sorted_starts,
+            self._sorted_ends,
+            self._sorted_canceled,
+        )
+        # Lessons are sorted by start: everything from the bisection point on starts after end_date
         return [
-            async_get_calendar_event_from_lessons(event, hass.config.time_zone)
-            for event in lessons
-            if not event.canceled
-            and _ensure_aware(event.end, tz) >= start_date
-            and _ensure_aware(event.start, tz) < end_date
+            _build_event(sorted_lessons[idx], starts[idx], ends[idx])
+            for idx in range(bisect.bisect_left(starts, end_date))
+            if not canceled[idx] and ends[idx] >= start_date
         ]
@@ -76,6 +76,19 @@ STEP_USER_DATA_SCHEMA_QR = vol.Schema(
     }
 )
 
+STEP_REAUTH_DATA_SCHEMA_UP = vol.Schema(
+    {
+        vol.Required("password"): str,
+    }
+)
+
+STEP_REAUTH_DATA_SCHEMA_QR = vol.Schema(
+    {
+        vol.Required("qr_code_json"): str,
+        vol.Required("qr_code_pin"): str,
+    }
+)
+
 
 class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Pronote."""
@@ -301,18 +314,9 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         connection_type = self._user_inputs.get("connection_type", "username_password")
         if connection_type == "qrcode":
-            schema = vol.Schema(
-                {
-                    vol.Required("qr_code_json"): str,
-                    vol.Required("qr_code_pin"): str,
-                }
-            )
+            schema = STEP_REAUTH_DATA_SCHEMA_QR
         else:
-            schema = vol.Schema(
-                {
-                    vol.Required("password"): str,
-                }
-            )
+            schema = STEP_REAUTH_DATA_SCHEMA_UP
 
         return self.async_show_form(
             step_id="reauth_confirm",
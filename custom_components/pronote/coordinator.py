@@ -6,6 +6,7 @@ import logging
 import re
 import time
 from datetime import date, datetime, timedelta
+from functools import cached_property
 from typing import Any
 from zoneinfo import ZoneInfo
 
@@ -26,6 +27,7 @@ from .api import (
 from .const import (
     DEFAULT_ALARM_OFFSET,
     DEFAULT_REFRESH_INTERVAL,
+    DOMAIN,
     EVENT_TYPE,
     HOMEWORK_MAX_DAYS,
     INFO_SURVEY_LIMIT_MAX_DAYS,
@@ -75,6 +77,11 @@ class PronoteDataUpdateCoordinator(TimestampDataUpdateCoordinator):
         self._previous_period_cache: dict[str, Any] | None = None
         self._previous_period_cache_date: date | None = None
 
+    @cached_property
+    def unique_id_prefix(self) -> str:
+        """Return the unique_id prefix shared by the entities of this child."""
+        return f"{DOMAIN}_{self.data['sensor_prefix']}_"
+
     async def _async_update_data(self) -> dict[str, Any]:
         """Get the latest data from Pronote and updates the state."""
         today = date.today()
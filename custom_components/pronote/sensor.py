@@ -13,7 +13,6 @@ from slugify import slugify
 from .const import (
     DEFAULT_GRADES_TO_DISPLAY,
     DEFAULT_LUNCH_BREAK_TIME,
-    DOMAIN,
     EVALUATIONS_TO_DISPLAY,
     TIMETABLE_PERIOD_MAX_LESSONS,
     PronoteConfigEntry,
@@ -184,7 +183,7 @@ class PronoteGenericSensor(PronoteEntity, SensorEntity):
         self._state = state
 
         self._attr_translation_key = coordinator_key
-        self._attr_unique_id = f"{DOMAIN}_{self.coordinator.data['sensor_prefix']}_{self._name}"
+        self._attr_unique_id = coordinator.unique_id_prefix + self._name
         self._attr_entity_registry_enabled_default = enabled_default
 
         if device_class is not None:
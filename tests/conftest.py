@@ -2,9 +2,13 @@
 
 from datetime import date, datetime, timedelta
 from types import SimpleNamespace
+from unittest.mock import MagicMock
 
 import pytest
 
+from custom_components.pronote.api import PronoteAPIClient
+from custom_components.pronote.api.auth import PronoteAuth
+
 
 @pytest.fixture(autouse=True)
 def auto_enable_custom_integrations(enable_custom_integrations):
@@ -12,6 +16,57 @@ def auto_enable_custom_integrations(enable_custom_integrations):
     yield
 
 
+@pytest.fixture
+def api_client():
+    """Create a fresh, unauthenticated API client."""
+    return PronoteAPIClient()
+
+
+@pytest.fixture
+def pronote_auth():
+    """Create a fresh authentication handler."""
+    return PronoteAuth()
+
+
+# Built once at import; each test configures these onto its own MagicMock
+# (a copied MagicMock would share child mocks and call lists between tests).
+_PRONOTEPY_CLIENT_ATTRS = {
+    "info": SimpleNamespace(name="Student", id="123", class_="3A", establishment="School"),
+    "password": "pass",
+    "export_credentials.return_value": {
+        "pronote_url": "https://example.com",
+        "username": "test",
+        "uuid": "uuid123",
+        "client_identifier": "client123",
+    },
+}
+
+
+@pytest.fixture
+def mock_pronote_client():
+    """Create a mock pronotepy client with the common student attributes."""
+    client = MagicMock()
+    client.configure_mock(**_PRONOTEPY_CLIENT_ATTRS)
+    return client
+
+
+# QR code / token_login exports carry the rotated password instead of client.password.
+_QR_CLIENT_EXPORT = {
+    "pronote_url": "https://example.com",
+    "username": "user",
+    "password": "new_password",
+    "uuid": "uuid123",
+}
+
+
+@pytest.fixture
+def qr_mock_client():
+    """Create a mock pronotepy client as returned by token_login/qrcode_login."""
+    client = MagicMock()
+    client.export_credentials.return_value = dict(_QR_CLIENT_EXPORT)
+    return client
+
+
 @pytest.fixture
 def mock_lesson():
     """Create a mock lesson."""
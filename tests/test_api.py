@@ -1,23 +1,114 @@
 """Tests for the Pronote API client."""
 
-from datetime import date, datetime
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
 from types import SimpleNamespace
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, create_autospec, patch
 
+import pronotepy
 import pytest
+from pronotepy import CryptoError, ENTLoginError
 
 from custom_components.pronote.api import (
     AuthenticationError,
     CircuitBreakerOpenError,
+    Credentials,
     InvalidResponseError,
     Lesson,
     PronoteAPIClient,
+    PronoteAPIError,
     RateLimitError,
 )
+from custom_components.pronote.api import ConnectionError as PronoteConnectionError
 from custom_components.pronote.api.auth import PronoteAuth
 from custom_components.pronote.api.circuit_breaker import CircuitBreaker
 
 
+@dataclass(slots=True)
+class _MockLesson:
+    """Stand-in for a pronotepy Lesson, read attribute by attribute by the converters."""
+
+    id: str
+    subject: str
+    start: datetime
+    end: datetime
+    classroom: str
+    teacher: str
+    canceled: bool
+    status: str
+    background_color: str
+    is_outside: bool
+    detention: bool
+
+
+def _make_mock_lesson(start, **overrides):
+    """Return a one-hour Math lesson starting at start, with any field overridden."""
+    fields = {
+        "id": "l1",
+        "subject": "Math",
+        "start": start,
+        "end": start + timedelta(hours=1),
+        "classroom": "A101",
+        "teacher": "M. Dupont",
+        "canceled": False,
+        "status": "",
+        "background_color": "",
+        "is_outside": False,
+        "detention": False,
+    }
+    fields.update(overrides)
+    return _MockLesson(**fields)
+
+
+@dataclass(slots=True)
+class _MockSubject:
+    """Stand-in for a pronotepy Subject."""
+
+    name: str
+
+
+@dataclass(slots=True)
+class _MockGrade:
+    """Stand-in for a pronotepy Grade."""
+
+    id: str
+    date: date
+    subject: _MockSubject
+    grade: str
+    out_of: str
+    coefficient: str
+    average: str
+    comment: str
+    is_bonus: bool
+    is_optionnal: bool
+
+
+@dataclass(slots=True)
+class _MockPeriod:
+    """Stand-in for a pronotepy Period (identity fields only)."""
+
+    id: str
+    name: str
+    start: date
+    end: date
+
+
+class _RaisingPeriod:
+    """Period whose overall_average raises when accessed."""
+
+    @property
+    def overall_average(self):
+        raise Exception("Access error")
+
+
+def _make_mock_period(**overrides):
+    """Return a fresh spec_set mock of a pronotepy Period with the given attributes."""
+    mock_period = create_autospec(pronotepy.Period, instance=True, spec_set=True)
+    for name, value in overrides.items():
+        setattr(mock_period, name, value)
+    return mock_period
+
+
 class TestCircuitBreaker:
     """Tests for the CircuitBreaker class."""
 
@@ -34,16 +125,16 @@ class TestCircuitBreaker:
         assert cb.is_open  # Open at 3 failures
 
     def test_closes_after_recovery_timeout(self):
-        import time
+        now = [1000.0]
 
-        cb = CircuitBreaker(failure_threshold=3, recovery_timeout=0.01)  # 10ms
+        cb = CircuitBreaker(failure_threshold=3, recovery_timeout=10, clock=lambda: now[0])
         cb.record_failure()
         cb.record_failure()
         cb.record_failure()
         assert cb.is_open
-        # Wait for recovery timeout
-        time.sleep(0.02)  # 20ms
-        # Circuit should now be closed (or at least checkable)
+        now[0] += 9
+        assert cb.is_open  # Still within the recovery timeout
+        now[0] += 1
         assert not cb.is_open
 
     def test_success_resets_counter(self):
@@ -59,47 +150,37 @@ class TestCircuitBreaker:
 class TestPronoteAuth:
     """Tests for the PronoteAuth class."""
 
-    def test_normalize_url_student(self):
-        auth = PronoteAuth()
-        result = auth._normalize_url("https://pronote.example.com/", "student")
-        assert "eleve.html" in result
-
-    def test_normalize_url_parent(self):
-        auth = PronoteAuth()
-        result = auth._normalize_url("https://pronote.example.com/", "parent")
-        assert "parent.html" in result
-
-    def test_normalize_url_no_trailing_slash(self):
-        auth = PronoteAuth()
-        result = auth._normalize_url("https://pronote.example.com", "student")
-        assert result.startswith("https://pronote.example.com/")
-
-    def test_normalize_url_removes_old_html(self):
-        auth = PronoteAuth()
-        result = auth._normalize_url("https://pronote.example.com/old.html", "student")
-        assert "old.html" not in result
-        assert "eleve.html" in result
-
-    def test_get_ent_with_none(self):
+    @pytest.mark.parametrize(
+        ("url", "account_type", "expected", "forbidden"),
+        [
+            ("https://pronote.example.com/", "student", ["eleve.html"], []),
+            ("https://pronote.example.com/", "parent", ["parent.html"], []),
+            ("https://pronote.example.com", "student", ["https://pronote.example.com/"], []),
+            ("https://pronote.example.com/old.html", "student", ["eleve.html"], ["old.html"]),
+        ],
+        ids=["student", "parent", "no_trailing_slash", "removes_old_html"],
+    )
+    def test_normalize_url(self, pronote_auth, url, account_type, expected, forbidden):
+        result = pronote_auth._normalize_url(url, account_type)
+        assert all(part in result for part in expected)
+        assert all(part not in result for part in forbidden)
+
+    def test_get_ent_with_none(self, pronote_auth):
         """Test _get_ent returns None when ent_name is None."""
-        auth = PronoteAuth()
-        result = auth._get_ent(None)
+        result = pronote_auth._get_ent(None)
         assert result is None
 
-    def test_get_ent_with_invalid_name(self):
+    def test_get_ent_with_invalid_name(self, monkeypatch, pronote_auth):
         """Test _get_ent returns None for invalid ENT name."""
-        from unittest.mock import patch
-
-        auth = PronoteAuth()
         # Mock pronotepy.ent as a simple object without the requested attribute
-        with patch("custom_components.pronote.api.auth.pronotepy") as mock_pronotepy:
-            mock_pronotepy.ent = type("MockENT", (), {})()  # Empty object
-            result = auth._get_ent("nonexistent_ent")
-            assert result is None
+        mock_pronotepy = MagicMock()
+        monkeypatch.setattr("custom_components.pronote.api.auth.pronotepy", mock_pronotepy)
+        mock_pronotepy.ent = type("MockENT", (), {})()  # Empty object
+        result = pronote_auth._get_ent("nonexistent_ent")
+        assert result is None
 
-    def test_refresh_credentials_success(self):
+    def test_refresh_credentials_success(self, pronote_auth):
         """Test refresh_credentials returns updated credentials."""
-        auth = PronoteAuth()
         mock_client = MagicMock()
         mock_client.export_credentials.return_value = {
             "pronote_url": "https://example.com",
@@ -109,89 +190,75 @@ class TestPronoteAuth:
         }
         mock_client.password = "newpassword"
 
-        result = auth.refresh_credentials(mock_client)
+        result = pronote_auth.refresh_credentials(mock_client)
         assert result is not None
         assert result.pronote_url == "https://example.com"
         assert result.username == "test"
         assert result.password == "newpassword"
 
-    def test_refresh_credentials_failure(self):
+    def test_refresh_credentials_failure(self, pronote_auth):
         """Test refresh_credentials returns None on failure."""
-        auth = PronoteAuth()
         mock_client = MagicMock()
         mock_client.export_credentials.side_effect = Exception("Export failed")
 
-        result = auth.refresh_credentials(mock_client)
+        result = pronote_auth.refresh_credentials(mock_client)
         assert result is None
 
-    async def test_authenticate_raises_on_none_client(self):
+    async def test_authenticate_raises_on_none_client(self, pronote_auth):
         """Test authenticate raises error when client is None."""
-        from unittest.mock import patch
-
-        auth = PronoteAuth()
-
-        with patch.object(auth, "_auth_username_password", return_value=(None, None)):
-            with pytest.raises(AuthenticationError, match="Client Pronote non créé"):
-                await auth.authenticate(
+        with patch.object(pronote_auth, "_auth_username_password", return_value=(None, None)):
+            with pytest.raises(AuthenticationError) as exc_info:
+                await pronote_auth.authenticate(
                     "username_password", {"url": "https://example.com", "username": "test", "password": "pass"}
                 )
+            assert "Client Pronote non créé" in str(exc_info.value)
 
-    async def test_authenticate_with_qrcode_missing_json(self):
+    async def test_authenticate_with_qrcode_missing_json(self, pronote_auth):
         """Test authenticate raises error when QR code JSON is missing."""
-        auth = PronoteAuth()
-
-        with pytest.raises(AuthenticationError, match="Aucun QR code ou token sauvegardé"):
-            await auth.authenticate("qrcode", {"account_type": "student"})
+        with pytest.raises(AuthenticationError) as exc_info:
+            await pronote_auth.authenticate("qrcode", {"account_type": "student"})
+        assert "Aucun QR code ou token sauvegardé" in str(exc_info.value)
 
 
 class TestPronoteAPIClient:
     """Tests for the PronoteAPIClient class."""
 
-    @pytest.mark.asyncio
-    async def test_authenticate_success(self):
+    async def test_authenticate_success(self, api_client):
         """Test successful authentication."""
-        client = PronoteAPIClient()
         mock_pronotepy_client = MagicMock()
 
         with patch.object(PronoteAuth, "authenticate", return_value=(mock_pronotepy_client, MagicMock())):
-            await client.authenticate("username_password", {})
+            await api_client.authenticate("username_password", {})
 
-        assert client.is_authenticated()
+        assert api_client.is_authenticated()
 
-    @pytest.mark.asyncio
-    async def test_authenticate_raises_authentication_error(self):
+    async def test_authenticate_raises_authentication_error(self, api_client):
         """Test that AuthenticationError is propagated."""
-        client = PronoteAPIClient()
-
         with patch.object(PronoteAuth, "authenticate", side_effect=AuthenticationError("Invalid credentials")):
             with pytest.raises(AuthenticationError):
-                await client.authenticate("username_password", {})
+                await api_client.authenticate("username_password", {})
 
-    @pytest.mark.asyncio
-    async def test_circuit_breaker_opens_after_failures(self):
+    async def test_circuit_breaker_opens_after_failures(self, api_client):
         """Test that circuit breaker opens after repeated failures."""
-
-        client = PronoteAPIClient()
-        client._circuit_breaker.failure_threshold = 3  # Lower threshold for test
+        api_client._circuit_breaker.failure_threshold = 3  # Lower threshold for test
 
         # Simulate 3 failures directly on circuit breaker
-        client._circuit_breaker.record_failure()
-        client._circuit_breaker.record_failure()
-        client._circuit_breaker.record_failure()
+        api_client._circuit_breaker.record_failure()
+        api_client._circuit_breaker.record_failure()
+        api_client._circuit_breaker.record_failure()
 
         # Circuit should be open now
-        assert client._circuit_breaker.is_open
+        assert api_client._circuit_breaker.is_open
 
         # Next call should raise CircuitBreakerOpenError immediately
         with pytest.raises(CircuitBreakerOpenError):
             # Use a mock that would succeed, but circuit breaker prevents it
             with patch.object(PronoteAuth, "authenticate", return_value=(MagicMock(), MagicMock())):
-                await client.authenticate("username_password", {})
+                await api_client.authenticate("username_password", {})
 
-    def test_is_authenticated_initially_false(self):
+    def test_is_authenticated_initially_false(self, api_client):
         """Test that client is not authenticated initially."""
-        client = PronoteAPIClient()
-        assert not client.is_authenticated()
+        assert not api_client.is_authenticated()
 
 
 class TestExceptions:
@@ -249,8 +316,7 @@ class TestClientConverters:
     """Tests for data converters in the client."""
 
     def test_convert_lesson(self):
-        client = PronoteAPIClient()
-        mock_lesson = SimpleNamespace(
+        mock_lesson = _MockLesson(
             id="lesson1",
             subject="Math",  # Simple string subject
             start=datetime(2025, 1, 15, 8, 0),
@@ -264,18 +330,17 @@ class TestClientConverters:
             detention=False,
         )
 
-        result = client._convert_lesson(mock_lesson)
+        result = PronoteAPIClient._convert_lesson(mock_lesson)
         assert result.id == "lesson1"
         assert result.subject == "Math"
         assert result.room == "A101"
         assert result.canceled is False
 
     def test_convert_grade(self):
-        client = PronoteAPIClient()
-        mock_grade = SimpleNamespace(
+        mock_grade = _MockGrade(
             id="grade1",
             date=date(2025, 1, 15),
-            subject=SimpleNamespace(name="Math"),
+            subject=_MockSubject(name="Math"),
             grade="15",
             out_of="20",
             coefficient="1",
@@ -285,46 +350,28 @@ class TestClientConverters:
             is_optionnal=False,
         )
 
-        result = client._convert_grade(mock_grade)
+        result = PronoteAPIClient._convert_grade(mock_grade)
         assert result.id == "grade1"
         assert result.grade == "15"
         assert result.grade_out_of == "20"
 
-    def test_convert_absence(self):
-        client = PronoteAPIClient()
-        mock_absence = SimpleNamespace(
-            id="abs1",
-            from_date=datetime(2025, 1, 15, 8, 0),
-            to_date=datetime(2025, 1, 15, 12, 0),
-            justified=True,
-            hours="4",
-            reasons="Sickness",
-        )
-
-        result = client._convert_absence(mock_absence)
-        assert result.id == "abs1"
-        assert result.justified is True
-        assert result.hours == "4"
-
     def test_convert_homework(self):
-        client = PronoteAPIClient()
         mock_hw = SimpleNamespace(
             id="hw1",
             date=date(2025, 1, 20),
-            subject=SimpleNamespace(name="Francais"),
+            subject=_MockSubject(name="Francais"),
             description="Exercice 5",
             done=False,
             background_color="#FFFFFF",
             files=[],
         )
 
-        result = client._convert_homework(mock_hw)
+        result = PronoteAPIClient._convert_homework(mock_hw)
         assert result.id == "hw1"
         assert result.description == "Exercice 5"
         assert result.done is False
 
     def test_convert_evaluation(self):
-        client = PronoteAPIClient()
         mock_eval = SimpleNamespace(
             id="eval1",
             date=datetime(2025, 1, 15, 10, 0),
@@ -338,7 +385,7 @@ class TestClientConverters:
             ],
         )
 
-        result = client._convert_evaluation(mock_eval)
+        result = PronoteAPIClient._convert_evaluation(mock_eval)
         assert result.id == "eval1"
         assert result.subject == "Math"
         assert result.name == "Test evaluation"
@@ -346,23 +393,7 @@ class TestClientConverters:
         assert result.acquisitions[0]["name"] == "Acquisition 1"
         assert result.acquisitions[0]["level"] == "A"
 
-    def test_convert_period(self):
-        client = PronoteAPIClient()
-        mock_period = SimpleNamespace(
-            id="period1",
-            name="Trimestre 1",
-            start=date(2025, 1, 1),
-            end=date(2025, 3, 31),
-        )
-
-        result = client._convert_period(mock_period)
-        assert result.id == "period1"
-        assert result.name == "Trimestre 1"
-        assert result.start == date(2025, 1, 1)
-        assert result.end == date(2025, 3, 31)
-
     def test_convert_punishment(self):
-        client = PronoteAPIClient()
         mock_punishment = SimpleNamespace(
             id="pun1",
             given=date(2025, 1, 15),
@@ -374,7 +405,7 @@ class TestClientConverters:
             exclusion_dates=[date(2025, 1, 16)],
         )
 
-        result = client._convert_punishment(mock_punishment)
+        result = PronoteAPIClient._convert_punishment(mock_punishment)
         assert result.id == "pun1"
         assert result.subject == "Math"
         assert result.reason == "Misbehavior"
@@ -383,41 +414,7 @@ class TestClientConverters:
         assert result.homework == "Write lines"
         assert len(result.exclusion_dates) == 1
 
-    def test_convert_delay(self):
-        client = PronoteAPIClient()
-        mock_delay = SimpleNamespace(
-            id="del1",
-            date=datetime(2025, 1, 15, 8, 30),
-            minutes=15,
-            justified=True,
-            reasons="Traffic jam",
-        )
-
-        result = client._convert_delay(mock_delay)
-        assert result.id == "del1"
-        assert result.minutes == 15
-        assert result.justified is True
-        assert result.reason == "Traffic jam"
-
-    def test_convert_average(self):
-        client = PronoteAPIClient()
-        mock_avg = SimpleNamespace(
-            subject="Math",
-            student="15.5",
-            min="10",
-            max="18",
-            class_average="14.5",
-        )
-
-        result = client._convert_average(mock_avg)
-        assert result.subject == "Math"
-        assert result.student == "15.5"
-        assert result.min == "10"
-        assert result.max == "18"
-        assert result.class_average == "14.5"
-
     def test_convert_menu(self):
-        client = PronoteAPIClient()
         mock_label = SimpleNamespace(name="Bio", color="#00FF00")
         mock_food = SimpleNamespace(name="Pizza", labels=[mock_label])
         mock_menu = SimpleNamespace(
@@ -433,7 +430,7 @@ class TestClientConverters:
             dessert=None,
         )
 
-        result = client._convert_menu(mock_menu)
+        result = PronoteAPIClient._convert_menu(mock_menu)
         assert result.date == date(2025, 1, 15)
         assert result.name == "Déjeuner"
         assert result.is_lunch is True
@@ -444,31 +441,71 @@ class TestClientConverters:
         assert result.main_meal is not None
         assert result.side_meal is None
 
-    def test_convert_info_survey(self):
-        client = PronoteAPIClient()
-        mock_info = SimpleNamespace(
-            id="info1",
-            title="Important information",
-            creation_date=datetime(2025, 1, 15, 10, 0),
-            author="School Admin",
-            read=False,
-            anonymous_response=False,
-        )
-
-        result = client._convert_info_survey(mock_info)
-        assert result.id == "info1"
-        assert result.title == "Important information"
-        assert result.author == "School Admin"
-        assert result.read is False
-        assert result.anonymous_response is False
+    @pytest.mark.parametrize(
+        ("converter", "raw", "expected"),
+        [
+            (
+                PronoteAPIClient._convert_absence,
+                SimpleNamespace(
+                    id="abs1",
+                    from_date=datetime(2025, 1, 15, 8, 0),
+                    to_date=datetime(2025, 1, 15, 12, 0),
+                    justified=True,
+                    hours="4",
+                    reasons="Sickness",
+                ),
+                {"id": "abs1", "justified": True, "hours": "4"},
+            ),
+            (
+                PronoteAPIClient._convert_period,
+                _MockPeriod(id="period1", name="Trimestre 1", start=date(2025, 1, 1), end=date(2025, 3, 31)),
+                {"id": "period1", "name": "Trimestre 1", "start": date(2025, 1, 1), "end": date(2025, 3, 31)},
+            ),
+            (
+                PronoteAPIClient._convert_delay,
+                SimpleNamespace(
+                    id="del1", date=datetime(2025, 1, 15, 8, 30), minutes=15, justified=True, reasons="Traffic jam"
+                ),
+                {"id": "del1", "minutes": 15, "justified": True, "reason": "Traffic jam"},
+            ),
+            (
+                PronoteAPIClient._convert_average,
+                SimpleNamespace(subject="Math", student="15.5", min="10", max="18", class_average="14.5"),
+                {"subject": "Math", "student": "15.5", "min": "10", "max": "18", "class_average": "14.5"},
+            ),
+            (
+                PronoteAPIClient._convert_info_survey,
+                SimpleNamespace(
+                    id="info1",
+                    title="Important information",
+                    creation_date=datetime(2025, 1, 15, 10, 0),
+                    author="School Admin",
+                    read=False,
+                    anonymous_response=False,
+                ),
+                {
+                    "id": "info1",
+                    "title": "Important information",
+                    "author": "School Admin",
+                    "read": False,
+                    "anonymous_response": False,
+                },
+            ),
+        ],
+        ids=["absence", "period", "delay", "average", "info_survey"],
+    )
+    def test_convert_flat_fields(self, converter, raw, expected):
+        result = converter(raw)
+        for field, value in expected.items():
+            actual = getattr(result, field)
+            # Booleans are checked by identity so truthy non-bool values cannot pass
+            assert actual is value if isinstance(value, bool) else actual == value, field
 
     def test_convert_lesson_with_subject_namespace(self):
-        client = PronoteAPIClient()
-        mock_lesson = SimpleNamespace(
+        mock_lesson = _make_mock_lesson(
+            datetime(2025, 1, 15, 10, 0),
             id="lesson2",
             subject="Physics",  # String subject
-            start=datetime(2025, 1, 15, 10, 0),
-            end=datetime(2025, 1, 15, 11, 0),
             classroom="B202",
             teacher="Mme Martin",
             canceled=True,
@@ -478,7 +515,7 @@ class TestClientConverters:
             detention=True,
         )
 
-        result = client._convert_lesson(mock_lesson)
+        result = PronoteAPIClient._convert_lesson(mock_lesson)
         assert result.subject == "Physics"
         assert result.canceled is True
         assert result.room == "B202"
@@ -490,209 +527,155 @@ class TestClientConverters:
 class TestPronoteAPIClientFetchData:
     """Tests for fetch_all_data and related methods."""
 
-    @pytest.mark.asyncio
-    async def test_fetch_all_data_not_authenticated(self):
+    async def test_fetch_all_data_not_authenticated(self, api_client):
         """Test fetch_all_data raises error when not authenticated."""
-        client = PronoteAPIClient()
+        with pytest.raises(AuthenticationError) as exc_info:
+            await api_client.fetch_all_data()
+        assert "Client non authentifié" in str(exc_info.value)
 
-        with pytest.raises(AuthenticationError, match="Client non authentifié"):
-            await client.fetch_all_data()
-
-    @pytest.mark.asyncio
-    async def test_fetch_all_data_circuit_breaker_open(self):
+    async def test_fetch_all_data_circuit_breaker_open(self, api_client):
         """Test fetch_all_data raises error when circuit breaker is open."""
-        client = PronoteAPIClient()
-        client._client = MagicMock()  # Simulate authenticated
-        client._circuit_breaker.record_failure()
-        client._circuit_breaker.record_failure()
-        client._circuit_breaker.record_failure()
-        client._circuit_breaker.record_failure()
-        client._circuit_breaker.record_failure()
+        api_client._client = MagicMock()  # Simulate authenticated
+        api_client._circuit_breaker.record_failure()
+        api_client._circuit_breaker.record_failure()
+        api_client._circuit_breaker.record_failure()
+        api_client._circuit_breaker.record_failure()
+        api_client._circuit_breaker.record_failure()
 
         with pytest.raises(CircuitBreakerOpenError):
-            await client.fetch_all_data()
+            await api_client.fetch_all_data()
 
-    @pytest.mark.asyncio
-    async def test_fetch_all_data_success_without_hass(self):
+    async def test_fetch_all_data_success_without_hass(self, api_client):
         """Test fetch_all_data without hass instance."""
-        client = PronoteAPIClient()
-        client._client = MagicMock()
-        client._client.info = SimpleNamespace(name="Test Student", id="123", class_="3A", establishment="Test School")
-        client._credentials = None
-        client._config_data = {"account_type": "student"}
-
-        with patch.object(client, "_fetch_all_data_sync", return_value=MagicMock()):
-            result = await client.fetch_all_data()
+        api_client._client = MagicMock()
+        api_client._client.info = SimpleNamespace(
+            name="Test Student", id="123", class_="3A", establishment="Test School"
+        )
+        api_client._credentials = None
+        api_client._config_data = {"account_type": "student"}
+
+        with patch.object(api_client, "_fetch_all_data_sync", return_value=MagicMock()):
+            result = await api_client.fetch_all_data()
             assert result is not None
 
-    def test_safe_get_lessons_with_exception(self):
+    def test_safe_get_lessons_with_exception(self, api_client):
         """Test _safe_get_lessons handles exceptions gracefully."""
-        client = PronoteAPIClient()
         mock_client = MagicMock()
         mock_client.lessons.side_effect = Exception("Network error")
 
-        result = client._safe_get_lessons(mock_client, date.today())
+        result = api_client._safe_get_lessons(mock_client, date.today())
         assert result is None
 
-    def test_safe_get_homework_with_exception(self):
+    def test_safe_get_homework_with_exception(self, api_client):
         """Test _safe_get_homework handles exceptions gracefully."""
-        client = PronoteAPIClient()
         mock_client = MagicMock()
         mock_client.homework.side_effect = Exception("Network error")
 
-        result = client._safe_get_homework(mock_client, date.today(), date.today())
+        result = api_client._safe_get_homework(mock_client, date.today(), date.today())
         assert result is None
 
-    def test_safe_get_menus_with_exception(self):
+    def test_safe_get_menus_with_exception(self, api_client):
         """Test _safe_get_menus handles exceptions gracefully."""
-        client = PronoteAPIClient()
         mock_client = MagicMock()
         mock_client.menus.side_effect = Exception("Network error")
 
-        result = client._safe_get_menus(mock_client, date.today())
+        result = api_client._safe_get_menus(mock_client, date.today())
         assert result is None
 
-    def test_safe_get_info_surveys_with_exception(self):
+    def test_safe_get_info_surveys_with_exception(self, api_client):
         """Test _safe_get_info_surveys handles exceptions gracefully."""
-        client = PronoteAPIClient()
         mock_client = MagicMock()
         mock_client.information_and_surveys.side_effect = Exception("Network error")
 
-        result = client._safe_get_info_surveys(mock_client, date.today(), 7)
+        result = api_client._safe_get_info_surveys(mock_client, date.today(), 7)
         assert result is None
 
-    def test_safe_get_ical_with_exception(self):
+    def test_safe_get_ical_with_exception(self, api_client):
         """Test _safe_get_ical handles exceptions gracefully."""
-        client = PronoteAPIClient()
         mock_client = MagicMock()
         mock_client.export_ical.side_effect = Exception("No iCal available")
 
-        result = client._safe_get_ical(mock_client)
+        result = api_client._safe_get_ical(mock_client)
         assert result is None
 
-    def test_safe_get_periods_with_exception(self):
+    def test_safe_get_periods_with_exception(self, api_client):
         """Test _safe_get_periods handles exceptions gracefully."""
-        client = PronoteAPIClient()
-        mock_client = MagicMock()
-        mock_client.periods = None
+        mock_client = SimpleNamespace(periods=None)
 
-        result = client._safe_get_periods(mock_client)
+        result = api_client._safe_get_periods(mock_client)
         assert result is None
 
-    def test_safe_get_overall_average_with_exception(self):
+    def test_safe_get_overall_average_with_exception(self, api_client):
         """Test _safe_get_overall_average handles exceptions gracefully."""
-        client = PronoteAPIClient()
         mock_period = MagicMock()
         # getattr will return None when attribute doesn't exist (no exception)
         del mock_period.overall_average
 
-        result = client._safe_get_overall_average(mock_period)
+        result = api_client._safe_get_overall_average(mock_period)
         assert result is None
 
-    def test_get_lessons_period_finds_lessons(self):
+    def test_get_lessons_period_finds_lessons(self, api_client):
         """Test _get_lessons_period finds lessons within max days."""
-        client = PronoteAPIClient()
         mock_client = MagicMock()
-        mock_lesson = SimpleNamespace(
-            id="l1",
-            subject="Math",
-            start=datetime(2025, 1, 16, 8, 0),
-            end=datetime(2025, 1, 16, 9, 0),
-            classroom="A101",
-            teacher="M. Dupont",
-            canceled=False,
-            status="",
-            background_color="",
-            is_outside=False,
-            detention=False,
-        )
+        mock_lesson = _make_mock_lesson(datetime(2025, 1, 16, 8, 0))
         mock_client.lessons.return_value = [mock_lesson]
 
         today = date(2025, 1, 15)
-        result = client._get_lessons_period(mock_client, today, max_days=30)
+        result = api_client._get_lessons_period(mock_client, today, max_days=30)
 
         assert result is not None
         assert len(result) == 1
 
-    def test_get_lessons_period_no_lessons_found(self):
+    def test_get_lessons_period_no_lessons_found(self, api_client):
         """Test _get_lessons_period returns None when no lessons found."""
-        client = PronoteAPIClient()
         mock_client = MagicMock()
         mock_client.lessons.return_value = []
 
         today = date(2025, 1, 15)
-        result = client._get_lessons_period(mock_client, today, max_days=1)
+        result = api_client._get_lessons_period(mock_client, today, max_days=1)
 
         assert result is None
 
-    def test_get_next_day_lessons_with_tomorrow_lessons(self):
+    def test_get_next_day_lessons_with_tomorrow_lessons(self, api_client):
         """Test _get_next_day_lessons returns tomorrow lessons when available."""
-        client = PronoteAPIClient()
         mock_client = MagicMock()
-        mock_lesson = SimpleNamespace(
-            id="l1",
-            subject="Math",
-            start=datetime(2025, 1, 16, 8, 0),
-            end=datetime(2025, 1, 16, 9, 0),
-            classroom="A101",
-            teacher="M. Dupont",
-            canceled=False,
-            status="",
-            background_color="",
-            is_outside=False,
-            detention=False,
-        )
+        mock_lesson = _make_mock_lesson(datetime(2025, 1, 16, 8, 0))
         tomorrow_lessons = [mock_lesson]
 
         today = date(2025, 1, 15)
-        result = client._get_next_day_lessons(mock_client, today, tomorrow_lessons, max_search=30)
+        result = api_client._get_next_day_lessons(mock_client, today, tomorrow_lessons, max_search=30)
 
         assert result == tomorrow_lessons
 
-    def test_get_next_day_lessons_searches_future(self):
+    def test_get_next_day_lessons_searches_future(self, api_client):
         """Test _get_next_day_lessons searches future days when tomorrow is empty."""
-        client = PronoteAPIClient()
         mock_client = MagicMock()
-        mock_lesson = SimpleNamespace(
-            id="l1",
-            subject="Math",
-            start=datetime(2025, 1, 18, 8, 0),
-            end=datetime(2025, 1, 18, 9, 0),
-            classroom="A101",
-            teacher="M. Dupont",
-            canceled=False,
-            status="",
-            background_color="",
-            is_outside=False,
-            detention=False,
-        )
+        mock_lesson = _make_mock_lesson(datetime(2025, 1, 18, 8, 0))
         mock_client.lessons.return_value = [mock_lesson]
 
         today = date(2025, 1, 15)
-        result = client._get_next_day_lessons(mock_client, today, None, max_search=30)
+        result = api_client._get_next_day_lessons(mock_client, today, None, max_search=30)
 
         assert result is not None
         assert len(result) == 1
 
-    def test_get_next_day_lessons_returns_none_when_max_reached(self):
+    def test_get_next_day_lessons_returns_none_when_max_reached(self, api_client):
         """Test _get_next_day_lessons returns None when max search reached."""
-        client = PronoteAPIClient()
         mock_client = MagicMock()
         mock_client.lessons.return_value = []
 
         today = date(2025, 1, 15)
-        result = client._get_next_day_lessons(mock_client, today, None, max_search=5)
+        result = api_client._get_next_day_lessons(mock_client, today, None, max_search=5)
 
         assert result is None
 
-    def test_get_lessons_period_exception_handling(self):
+    def test_get_lessons_period_exception_handling(self, api_client):
         """Test _get_lessons_period handles exceptions gracefully."""
-        client = PronoteAPIClient()
         mock_client = MagicMock()
         mock_client.lessons.side_effect = Exception("Network error")
 
         today = date(2025, 1, 15)
-        result = client._get_lessons_period(mock_client, today, max_days=5)
+        result = api_client._get_lessons_period(mock_client, today, max_days=5)
 
         assert result is None
 
@@ -700,152 +683,110 @@ class TestPronoteAPIClientFetchData:
 class TestPronoteAPIClientFetchAllData:
     """Tests for fetch_all_data method."""
 
-    @pytest.mark.asyncio
-    async def test_fetch_all_data_not_authenticated(self):
+    async def test_fetch_all_data_not_authenticated(self, api_client):
         """Test fetch_all_data raises error when not authenticated."""
-        client = PronoteAPIClient()
+        with pytest.raises(AuthenticationError) as exc_info:
+            await api_client.fetch_all_data()
+        assert "Client non authentifié" in str(exc_info.value)
 
-        with pytest.raises(AuthenticationError, match="Client non authentifié"):
-            await client.fetch_all_data()
-
-    @pytest.mark.asyncio
-    async def test_fetch_all_data_circuit_breaker_open(self):
+    async def test_fetch_all_data_circuit_breaker_open(self, api_client):
         """Test fetch_all_data raises error when circuit breaker is open."""
-        client = PronoteAPIClient()
-        client._client = MagicMock()  # Simulate authenticated
-        client._circuit_breaker.record_failure()
-        client._circuit_breaker.record_failure()
-        client._circuit_breaker.record_failure()
-        client._circuit_breaker.record_failure()
-        client._circuit_breaker.record_failure()
+        api_client._client = MagicMock()  # Simulate authenticated
+        api_client._circuit_breaker.record_failure()
+        api_client._circuit_breaker.record_failure()
+        api_client._circuit_breaker.record_failure()
+        api_client._circuit_breaker.record_failure()
+        api_client._circuit_breaker.record_failure()
 
         with pytest.raises(CircuitBreakerOpenError):
-            await client.fetch_all_data()
+            await api_client.fetch_all_data()
 
-    @pytest.mark.asyncio
-    async def test_fetch_all_data_success_without_hass(self):
+    async def test_fetch_all_data_success_without_hass(self, api_client):
         """Test fetch_all_data without hass instance."""
-        client = PronoteAPIClient()
-        client._client = MagicMock()
-        client._credentials = None
-        client._config_data = {"account_type": "student"}
+        api_client._client = MagicMock()
+        api_client._credentials = None
+        api_client._config_data = {"account_type": "student"}
 
-        with patch.object(client, "_fetch_all_data_sync", return_value=MagicMock()):
-            result = await client.fetch_all_data()
+        with patch.object(api_client, "_fetch_all_data_sync", return_value=MagicMock()):
+            result = await api_client.fetch_all_data()
             assert result is not None
 
-    @pytest.mark.asyncio
-    async def test_fetch_all_data_timeout_error(self):
+    async def test_fetch_all_data_timeout_error(self, api_client):
         """Test fetch_all_data handles timeout error."""
-        from custom_components.pronote.api import ConnectionError
-
-        client = PronoteAPIClient()
-        client._client = MagicMock()
+        api_client._client = MagicMock()
 
-        with patch.object(client, "_fetch_all_data_sync", side_effect=TimeoutError("Timeout")):
-            with pytest.raises(ConnectionError, match="Timeout fetch"):
-                await client.fetch_all_data()
+        with patch.object(api_client, "_fetch_all_data_sync", side_effect=TimeoutError("Timeout")):
+            with pytest.raises(PronoteConnectionError) as exc_info:
+                await api_client.fetch_all_data()
+            assert "Timeout fetch" in str(exc_info.value)
 
-    @pytest.mark.asyncio
-    async def test_fetch_all_data_generic_exception(self):
+    async def test_fetch_all_data_generic_exception(self, api_client):
         """Test fetch_all_data handles generic exceptions."""
-        from custom_components.pronote.api import InvalidResponseError
-
-        client = PronoteAPIClient()
-        client._client = MagicMock()
+        api_client._client = MagicMock()
 
-        with patch.object(client, "_fetch_all_data_sync", side_effect=ValueError("Unknown")):
+        with patch.object(api_client, "_fetch_all_data_sync", side_effect=ValueError("Unknown")):
             with pytest.raises(InvalidResponseError):
-                await client.fetch_all_data()
+                await api_client.fetch_all_data()
 
 
 class TestPronoteAPIClientAuthenticate:
     """Tests for authenticate method."""
 
-    @pytest.mark.asyncio
-    async def test_authenticate_circuit_breaker_open(self):
+    async def test_authenticate_circuit_breaker_open(self, api_client):
         """Test authenticate raises error when circuit breaker is open."""
-        client = PronoteAPIClient()
-        client._circuit_breaker.record_failure()
-        client._circuit_breaker.record_failure()
-        client._circuit_breaker.record_failure()
-        client._circuit_breaker.record_failure()
-        client._circuit_breaker.record_failure()
+        api_client._circuit_breaker.record_failure()
+        api_client._circuit_breaker.record_failure()
+        api_client._circuit_breaker.record_failure()
+        api_client._circuit_breaker.record_failure()
+        api_client._circuit_breaker.record_failure()
 
         with pytest.raises(CircuitBreakerOpenError):
-            await client.authenticate("username_password", {})
+            await api_client.authenticate("username_password", {})
 
-    @pytest.mark.asyncio
-    async def test_authenticate_timeout_error(self):
+    async def test_authenticate_timeout_error(self, api_client):
         """Test authenticate handles timeout error."""
-        from custom_components.pronote.api import ConnectionError
+        with patch.object(api_client._auth, "authenticate", side_effect=TimeoutError("Timeout")):
+            with pytest.raises(PronoteConnectionError) as exc_info:
+                await api_client.authenticate("username_password", {})
+            assert "Timeout authentification" in str(exc_info.value)
 
-        client = PronoteAPIClient()
-
-        with patch.object(client._auth, "authenticate", side_effect=TimeoutError("Timeout")):
-            with pytest.raises(ConnectionError, match="Timeout authentification"):
-                await client.authenticate("username_password", {})
-
-    @pytest.mark.asyncio
-    async def test_authenticate_generic_exception(self):
+    async def test_authenticate_generic_exception(self, api_client):
         """Test authenticate handles generic exceptions."""
-        from custom_components.pronote.api import AuthenticationError
-
-        client = PronoteAPIClient()
-
-        with patch.object(client._auth, "authenticate", side_effect=ValueError("Unknown")):
+        with patch.object(api_client._auth, "authenticate", side_effect=ValueError("Unknown")):
             with pytest.raises(AuthenticationError):
-                await client.authenticate("username_password", {})
+                await api_client.authenticate("username_password", {})
 
 
 class TestPronoteAPIClientIsAuthenticated:
     """Tests for is_authenticated method."""
 
-    def test_is_authenticated_true(self):
+    def test_is_authenticated_true(self, api_client):
         """Test is_authenticated returns True when client is set."""
-        client = PronoteAPIClient()
-        client._client = MagicMock()
-        assert client.is_authenticated() is True
+        api_client._client = MagicMock()
+        assert api_client.is_authenticated() is True
 
-    def test_is_authenticated_false(self):
+    def test_is_authenticated_false(self, api_client):
         """Test is_authenticated returns False when client is None."""
-        client = PronoteAPIClient()
-        client._client = None
-        assert client.is_authenticated() is False
+        api_client._client = None
+        assert api_client.is_authenticated() is False
 
 
 class TestPronoteAPIClientSafeGetSuccess:
     """Tests for _safe_get_* methods with successful returns."""
 
-    def test_safe_get_lessons_success(self):
+    def test_safe_get_lessons_success(self, api_client):
         """Test _safe_get_lessons returns converted lessons."""
-        client = PronoteAPIClient()
-        mock_client = MagicMock()
-        mock_lesson = SimpleNamespace(
-            id="l1",
-            subject="Math",
-            start=datetime(2025, 1, 15, 8, 0),
-            end=datetime(2025, 1, 15, 9, 0),
-            classroom="A101",
-            teacher="M. Dupont",
-            canceled=False,
-            status="",
-            background_color="",
-            is_outside=False,
-            detention=False,
-        )
-        mock_client.lessons.return_value = [mock_lesson]
+        mock_lesson = _make_mock_lesson(datetime(2025, 1, 15, 8, 0))
+        mock_client = SimpleNamespace(lessons=lambda *_: [mock_lesson])
 
-        result = client._safe_get_lessons(mock_client, date(2025, 1, 15))
+        result = api_client._safe_get_lessons(mock_client, date(2025, 1, 15))
 
         assert result is not None
         assert len(result) == 1
         assert result[0].subject == "Math"
 
-    def test_safe_get_homework_success(self):
+    def test_safe_get_homework_success(self, api_client):
         """Test _safe_get_homework returns converted homework."""
-        client = PronoteAPIClient()
-        mock_client = MagicMock()
         mock_homework = SimpleNamespace(
             id="h1",
             date=date(2025, 1, 15),
@@ -855,34 +796,30 @@ class TestPronoteAPIClientSafeGetSuccess:
             background_color=None,
             files=None,
         )
-        mock_client.homework.return_value = [mock_homework]
+        mock_client = SimpleNamespace(homework=lambda *_: [mock_homework])
 
-        result = client._safe_get_homework(mock_client, date(2025, 1, 15), date(2025, 1, 22))
+        result = api_client._safe_get_homework(mock_client, date(2025, 1, 15), date(2025, 1, 22))
 
         assert result is not None
         assert len(result) == 1
         assert result[0].subject == "Math"
 
-    def test_safe_get_menus_success(self):
+    def test_safe_get_menus_success(self, api_client):
         """Test _safe_get_menus returns converted menus."""
-        client = PronoteAPIClient()
-        mock_client = MagicMock()
         mock_menu = SimpleNamespace(
             date=date(2025, 1, 15),
             lunch=["Pizza", "Salad"],
             dinner=["Soup"],
         )
-        mock_client.menus.return_value = [mock_menu]
+        mock_client = SimpleNamespace(menus=lambda *_: [mock_menu])
 
-        result = client._safe_get_menus(mock_client, date(2025, 1, 15))
+        result = api_client._safe_get_menus(mock_client, date(2025, 1, 15))
 
         assert result is not None
         assert len(result) == 1
 
-    def test_safe_get_info_surveys_success(self):
+    def test_safe_get_info_surveys_success(self, api_client):
         """Test _safe_get_info_surveys returns converted info."""
-        client = PronoteAPIClient()
-        mock_client = MagicMock()
         mock_info = SimpleNamespace(
             id="i1",
             title="Important",
@@ -891,49 +828,38 @@ class TestPronoteAPIClientSafeGetSuccess:
             read=False,
             anonymous_response=False,
         )
-        mock_client.information_and_surveys.return_value = [mock_info]
+        mock_client = SimpleNamespace(information_and_surveys=lambda *_: [mock_info])
 
-        result = client._safe_get_info_surveys(mock_client, date(2025, 1, 15), 7)
+        result = api_client._safe_get_info_surveys(mock_client, date(2025, 1, 15), 7)
 
         assert result is not None
         assert len(result) == 1
         assert result[0].title == "Important"
 
-    def test_safe_get_ical_success(self):
+    def test_safe_get_ical_success(self, api_client):
         """Test _safe_get_ical returns iCal URL."""
-        client = PronoteAPIClient()
-        mock_client = MagicMock()
-        mock_client.export_ical.return_value = "https://example.com/ical"
+        mock_client = SimpleNamespace(export_ical=lambda: "https://example.com/ical")
 
-        result = client._safe_get_ical(mock_client)
+        result = api_client._safe_get_ical(mock_client)
 
         assert result == "https://example.com/ical"
 
-    def test_safe_get_periods_success(self):
+    def test_safe_get_periods_success(self, api_client):
         """Test _safe_get_periods returns converted periods."""
-        client = PronoteAPIClient()
-        mock_client = MagicMock()
-        mock_period = SimpleNamespace(
-            id="p1",
-            name="Trimestre 1",
-            start=date(2025, 1, 1),
-            end=date(2025, 3, 31),
-        )
-        mock_client.periods = [mock_period]
+        mock_period = _MockPeriod(id="p1", name="Trimestre 1", start=date(2025, 1, 1), end=date(2025, 3, 31))
+        mock_client = SimpleNamespace(periods=[mock_period])
 
-        result = client._safe_get_periods(mock_client)
+        result = api_client._safe_get_periods(mock_client)
 
         assert result is not None
         assert len(result) == 1
         assert result[0].name == "Trimestre 1"
 
-    def test_safe_get_overall_average_success(self):
+    def test_safe_get_overall_average_success(self, api_client):
         """Test _safe_get_overall_average returns average as float."""
-        client = PronoteAPIClient()
-        mock_period = MagicMock()
-        mock_period.overall_average = "15.5"
+        mock_period = _make_mock_period(overall_average="15.5")
 
-        result = client._safe_get_overall_average(mock_period)
+        result = api_client._safe_get_overall_average(mock_period)
 
         assert result == 15.5
 
@@ -941,230 +867,192 @@ class TestPronoteAPIClientSafeGetSuccess:
 class TestPronoteAPIClientFetchAllDataSync:
     """Tests for _fetch_all_data_sync method."""
 
-    def test_fetch_all_data_sync_not_authenticated(self):
+    @pytest.fixture
+    def all_safe_getters_patched(self, api_client, monkeypatch):
+        """Stub every _safe_get_* fetcher with an empty result; tests override what they need."""
+        for name, value in (
+            ("_safe_get_lessons", []),
+            ("_safe_get_period_data", []),
+            ("_safe_get_homework", []),
+            ("_safe_get_info_surveys", []),
+            ("_safe_get_menus", []),
+            ("_safe_get_periods", []),
+            ("_safe_get_ical", None),
+        ):
+            monkeypatch.setattr(api_client, name, MagicMock(return_value=value))
+        return api_client
+
+    def test_fetch_all_data_sync_not_authenticated(self, api_client):
         """Test _fetch_all_data_sync raises error when not authenticated."""
-        client = PronoteAPIClient()
-        client._client = None
+        api_client._client = None
 
-        with pytest.raises(AuthenticationError, match="Client non initialisé"):
-            client._fetch_all_data_sync(date(2025, 1, 15), 15, 15, 7)
+        with pytest.raises(AuthenticationError) as exc_info:
+            api_client._fetch_all_data_sync(date(2025, 1, 15), 15, 15, 7)
+        assert "Client non initialisé" in str(exc_info.value)
 
-    def test_fetch_all_data_sync_parent_account(self):
+    def test_fetch_all_data_sync_parent_account(self, all_safe_getters_patched):
         """Test _fetch_all_data_sync with parent account."""
-        client = PronoteAPIClient()
-        client._client = MagicMock()
-        client._client.info = SimpleNamespace(name="Parent", id="123", class_=None, establishment=None)
-        client._config_data = {"account_type": "parent", "child": "Child1"}
-
-        with patch.object(client, "_safe_get_lessons", return_value=[]):
-            with patch.object(client, "_safe_get_period_data", return_value=[]):
-                with patch.object(client, "_safe_get_homework", return_value=[]):
-                    with patch.object(client, "_safe_get_info_surveys", return_value=[]):
-                        with patch.object(client, "_safe_get_menus", return_value=[]):
-                            with patch.object(client, "_safe_get_periods", return_value=[]):
-                                with patch.object(client, "_safe_get_ical", return_value=None):
-                                    result = client._fetch_all_data_sync(date(2025, 1, 15), 15, 15, 7)
+        api_client = all_safe_getters_patched
+        api_client._client = MagicMock()
+        api_client._client.info = SimpleNamespace(name="Parent", id="123", class_=None, establishment=None)
+        api_client._config_data = {"account_type": "parent", "child": "Child1"}
+
+        result = api_client._fetch_all_data_sync(date(2025, 1, 15), 15, 15, 7)
 
         assert result is not None
         assert result.child_info is not None
 
-    def test_fetch_all_data_sync_with_previous_periods(self):
+    def test_fetch_all_data_sync_with_previous_periods(self, all_safe_getters_patched, mock_pronote_client):
         """Test _fetch_all_data_sync with previous periods data."""
-        from custom_components.pronote.api.models import Credentials
-
-        client = PronoteAPIClient()
-        client._client = MagicMock()
-        client._client.info = SimpleNamespace(name="Student", id="123", class_="3A", establishment="School")
+        api_client = all_safe_getters_patched
+        api_client._client = mock_pronote_client
 
         # Mock credentials
-        client._credentials = Credentials(
+        api_client._credentials = Credentials(
             pronote_url="https://example.com",
             username="test",
             password="pass",
             uuid="uuid123",
             client_identifier="client123",
         )
-        client._config_data = {"account_type": "student"}
+        api_client._config_data = {"account_type": "student"}
 
         # Mock periods with trimestre
-        mock_current_period = SimpleNamespace(
-            id="p2",
-            name="Trimestre 2",
-            start=date(2025, 1, 15),
-            end=date(2025, 3, 31),
-        )
-        mock_previous_period = SimpleNamespace(
-            id="p1",
-            name="Trimestre 1",
-            start=date(2024, 9, 1),
-            end=date(2024, 12, 31),
-        )
-        client._client.current_period = mock_current_period
-        client._client.periods = [mock_current_period, mock_previous_period]
-
-        with patch.object(client, "_safe_get_lessons", return_value=[]):
-            with patch.object(client, "_safe_get_period_data", return_value=[]):
-                with patch.object(client, "_safe_get_homework", return_value=[]):
-                    with patch.object(client, "_safe_get_info_surveys", return_value=[]):
-                        with patch.object(client, "_safe_get_menus", return_value=[]):
-                            with patch.object(
-                                client,
-                                "_safe_get_periods",
-                                return_value=[
-                                    SimpleNamespace(
-                                        id="p2", name="Trimestre 2", start=date(2025, 1, 15), end=date(2025, 3, 31)
-                                    ),
-                                    SimpleNamespace(
-                                        id="p1", name="Trimestre 1", start=date(2024, 9, 1), end=date(2024, 12, 31)
-                                    ),
-                                ],
-                            ):
-                                with patch.object(client, "_safe_get_ical", return_value=None):
-                                    result = client._fetch_all_data_sync(date(2025, 1, 15), 15, 15, 7)
+        mock_current_period = _MockPeriod(id="p2", name="Trimestre 2", start=date(2025, 1, 15), end=date(2025, 3, 31))
+        mock_previous_period = _MockPeriod(id="p1", name="Trimestre 1", start=date(2024, 9, 1), end=date(2024, 12, 31))
+        api_client._client.current_period = mock_current_period
+        api_client._client.periods = [mock_current_period, mock_previous_period]
+
+        api_client._safe_get_periods.return_value = [mock_current_period, mock_previous_period]
+
+        result = api_client._fetch_all_data_sync(date(2025, 1, 15), 15, 15, 7)
 
         assert result is not None
         assert result.credentials is not None
         assert result.credentials["pronote_url"] == "https://example.com"
         assert result.password == "pass"
 
-    def test_get_next_day_lessons_with_exception(self):
+    def test_get_next_day_lessons_with_exception(self, api_client):
         """Test _get_next_day_lessons handles exceptions."""
-        client = PronoteAPIClient()
         mock_client = MagicMock()
         mock_client.lessons.side_effect = Exception("Network error")
 
         today = date(2025, 1, 15)
-        result = client._get_next_day_lessons(mock_client, today, None, max_search=5)
+        result = api_client._get_next_day_lessons(mock_client, today, None, max_search=5)
 
         assert result is None
 
-    def test_safe_get_period_data_with_exception(self):
+    def test_safe_get_period_data_with_exception(self, api_client):
         """Test _safe_get_period_data handles exceptions."""
-        client = PronoteAPIClient()
-        mock_period = MagicMock()
-        mock_period.grades = None
+        mock_period = _make_mock_period(grades=None)
 
         def mock_converter(item):
             return item
 
-        result = client._safe_get_period_data(mock_period, "grades", mock_converter)
+        result = api_client._safe_get_period_data(mock_period, "grades", mock_converter)
         assert result is None
 
-    def test_safe_get_overall_average_with_exception(self):
+    def test_safe_get_overall_average_with_exception(self, api_client):
         """Test _safe_get_overall_average handles exceptions."""
-        client = PronoteAPIClient()
-
-        # Create a class that raises an exception when accessing overall_average
-        class RaisingPeriod:
-            @property
-            def overall_average(self):
-                raise Exception("Access error")
-
-        mock_period = RaisingPeriod()
-        result = client._safe_get_overall_average(mock_period)
+        mock_period = _RaisingPeriod()
+        result = api_client._safe_get_overall_average(mock_period)
         assert result is None
 
 
 class TestPronoteAPIClientPronoteAPIError:
     """Tests for PronoteAPIError handling."""
 
-    @pytest.mark.asyncio
-    async def test_fetch_all_data_raises_pronote_api_error(self):
+    async def test_fetch_all_data_raises_pronote_api_error(self, api_client):
         """Test fetch_all_data propagates PronoteAPIError."""
-        from custom_components.pronote.api import PronoteAPIError
-
-        client = PronoteAPIClient()
-        client._client = MagicMock()
-        client._config_data = {"account_type": "student"}
+        api_client._client = MagicMock()
+        api_client._config_data = {"account_type": "student"}
 
-        with patch.object(client, "_fetch_all_data_sync", side_effect=PronoteAPIError("API error")):
+        with patch.object(api_client, "_fetch_all_data_sync", side_effect=PronoteAPIError("API error")):
             with pytest.raises(PronoteAPIError):
-                await client.fetch_all_data()
+                await api_client.fetch_all_data()
 
 
 class TestPronoteAuthExceptions:
     """Tests for PronoteAuth exception handling."""
 
-    async def test_authenticate_raises_crypto_error(self):
+    async def test_authenticate_raises_crypto_error(self, pronote_auth):
         """Test authenticate raises AuthenticationError on CryptoError."""
-        from pronotepy import CryptoError
-
-        auth = PronoteAuth()
-
-        with patch.object(auth, "_auth_username_password", side_effect=CryptoError("Crypto failed")):
-            with pytest.raises(AuthenticationError, match="Cryptographie/QR code invalide"):
-                await auth.authenticate(
+        with patch.object(pronote_auth, "_auth_username_password", side_effect=CryptoError("Crypto failed")):
+            with pytest.raises(AuthenticationError) as exc_info:
+                await pronote_auth.authenticate(
                     "username_password", {"url": "https://example.com", "username": "test", "password": "pass"}
                 )
+            assert "Cryptographie/QR code invalide" in str(exc_info.value)
 
-    async def test_authenticate_raises_ent_login_error(self):
+    async def test_authenticate_raises_ent_login_error(self, pronote_auth):
         """Test authenticate raises AuthenticationError on ENTLoginError."""
-        from pronotepy import ENTLoginError
-
-        auth = PronoteAuth()
-
-        with patch.object(auth, "_auth_username_password", side_effect=ENTLoginError("ENT failed")):
-            with pytest.raises(AuthenticationError, match="Échec login ENT"):
-                await auth.authenticate(
+        with patch.object(pronote_auth, "_auth_username_password", side_effect=ENTLoginError("ENT failed")):
+            with pytest.raises(AuthenticationError) as exc_info:
+                await pronote_auth.authenticate(
                     "username_password", {"url": "https://example.com", "username": "test", "password": "pass"}
                 )
+            assert "Échec login ENT" in str(exc_info.value)
 
-    async def test_authenticate_raises_connection_error(self):
+    async def test_authenticate_raises_connection_error(self, pronote_auth):
         """Test authenticate propagates ConnectionError."""
-        from custom_components.pronote.api import ConnectionError as PronoteConnectionError
-
-        auth = PronoteAuth()
-
-        with patch.object(auth, "_auth_username_password", side_effect=PronoteConnectionError("Network failed")):
-            with pytest.raises(PronoteConnectionError, match="Erreur réseau"):
-                await auth.authenticate(
+        with patch.object(
+            pronote_auth, "_auth_username_password", side_effect=PronoteConnectionError("Network failed")
+        ):
+            with pytest.raises(PronoteConnectionError) as exc_info:
+                await pronote_auth.authenticate(
                     "username_password", {"url": "https://example.com", "username": "test", "password": "pass"}
                 )
+            assert "Erreur réseau" in str(exc_info.value)
 
-    async def test_authenticate_session_check_fails(self):
-        """Test authenticate continues when session_check fails."""
-        auth = PronoteAuth()
+    async def test_authenticate_session_check_failure_continues(self, pronote_auth):
+        """Test authenticate continues even if session_check fails."""
         mock_client = MagicMock()
         mock_client.session_check.side_effect = Exception("Session check failed")
+        mock_creds = MagicMock()
 
-        with patch.object(auth, "_auth_username_password", return_value=(mock_client, MagicMock())):
-            client, creds = await auth.authenticate(
-                "username_password", {"url": "https://example.com", "username": "test", "password": "pass"}
+        with patch.object(pronote_auth, "_auth_username_password", return_value=(mock_client, mock_creds)):
+            client, creds = await pronote_auth.authenticate(
+                "username_password",
+                {
+                    "url": "https://example.com",
+                    "username": "test",
+                    "password": "pass",
+                },
             )
 
-        assert client == mock_client
+        assert client is mock_client
+        mock_client.session_check.assert_called_once()
 
 
 class TestPronoteAuthUsernamePassword:
     """Tests for _auth_username_password method."""
 
-    def test_auth_username_password_export_credentials_fails(self):
+    @pytest.mark.parametrize("url", ["https://example.com", "https://example.com/pronote/"])
+    def test_auth_username_password_export_credentials_fails(self, monkeypatch, pronote_auth, mock_pronote_client, url):
         """Test _auth_username_password continues when export_credentials fails."""
-        auth = PronoteAuth()
-        mock_client = MagicMock()
+        mock_client = mock_pronote_client
         mock_client.export_credentials.side_effect = Exception("Export failed")
         mock_client.password = "password123"
 
-        with patch("custom_components.pronote.api.auth.pronotepy.Client", return_value=mock_client):
-            client, creds = auth._auth_username_password(
-                {"url": "https://example.com", "username": "test", "password": "pass"}, "student"
-            )
+        monkeypatch.setattr("custom_components.pronote.api.auth.pronotepy.Client", MagicMock(return_value=mock_client))
+        client, creds = pronote_auth._auth_username_password(
+            {"url": url, "username": "test", "password": "pass"}, "student"
+        )
 
-        assert client == mock_client
+        assert client is mock_client
         assert "eleve.html" in creds.pronote_url
         assert creds.username == "test"
         assert creds.password == "pass"
 
-    def test_auth_username_password_cleans_account_pin(self):
+    def test_auth_username_password_cleans_account_pin(self, monkeypatch, pronote_auth, mock_pronote_client):
         """Test _auth_username_password cleans account_pin attribute."""
-        auth = PronoteAuth()
-        mock_client = MagicMock()
+        mock_client = mock_pronote_client
         mock_client.account_pin = "1234"
 
-        with patch("custom_components.pronote.api.auth.pronotepy.Client", return_value=mock_client):
-            auth._auth_username_password(
-                {"url": "https://example.com", "username": "test", "password": "pass"}, "student"
-            )
+        monkeypatch.setattr("custom_components.pronote.api.auth.pronotepy.Client", MagicMock(return_value=mock_client))
+        pronote_auth._auth_username_password(
+            {"url": "https://example.com", "username": "test", "password": "pass"}, "student"
+        )
 
         assert not hasattr(mock_client, "account_pin")
 
@@ -1172,16 +1060,9 @@ class TestPronoteAuthUsernamePassword:
 class TestPronoteAuthQRCode:
     """Tests for _auth_qrcode method."""
 
-    def test_auth_qrcode_token_login_success(self):
+    def test_auth_qrcode_token_login_success(self, monkeypatch, pronote_auth, qr_mock_client):
         """Test _auth_qrcode with token_login when credentials exist."""
-        auth = PronoteAuth()
-        mock_client = MagicMock()
-        mock_client.export_credentials.return_value = {
-            "pronote_url": "https://example.com",
-            "username": "user",
-            "password": "new_password",
-            "uuid": "uuid123",
-        }
+        mock_client = qr_mock_client
 
         data = {
             "qr_code_url": "https://example.com",
@@ -1190,17 +1071,18 @@ class TestPronoteAuthQRCode:
             "qr_code_uuid": "uuid123",
         }
 
-        with patch("custom_components.pronote.api.auth.pronotepy.Client.token_login", return_value=mock_client):
-            client, creds = auth._auth_qrcode(data, "student")
+        monkeypatch.setattr(
+            "custom_components.pronote.api.auth.pronotepy.Client.token_login", MagicMock(return_value=mock_client)
+        )
+        client, creds = pronote_auth._auth_qrcode(data, "student")
 
         assert client == mock_client
         assert creds.pronote_url == "https://example.com"
         assert creds.username == "user"
         assert creds.password == "new_password"
 
-    def test_auth_qrcode_token_login_uses_exported_credentials(self):
+    def test_auth_qrcode_token_login_uses_exported_credentials(self, monkeypatch, pronote_auth):
         """Test _auth_qrcode uses export_credentials after token_login (uuid/password may change)."""
-        auth = PronoteAuth()
         mock_client = MagicMock()
         mock_client.export_credentials.return_value = {
             "pronote_url": "https://new-server.com",
@@ -1218,8 +1100,10 @@ class TestPronoteAuthQRCode:
             "client_identifier": "old_client_id",
         }
 
-        with patch("custom_components.pronote.api.auth.pronotepy.Client.token_login", return_value=mock_client):
-            client, creds = auth._auth_qrcode(data, "student")
+        monkeypatch.setattr(
+            "custom_components.pronote.api.auth.pronotepy.Client.token_login", MagicMock(return_value=mock_client)
+        )
+        client, creds = pronote_auth._auth_qrcode(data, "student")
 
         assert client == mock_client
         assert creds.pronote_url == "https://new-server.com"
@@ -1228,10 +1112,8 @@ class TestPronoteAuthQRCode:
         assert creds.uuid == "new_uuid_from_server"
         assert creds.client_identifier == "new_client_id"
 
-    def test_auth_qrcode_token_login_failure_raises_auth_error_without_qr(self):
+    def test_auth_qrcode_token_login_failure_raises_auth_error_without_qr(self, monkeypatch, pronote_auth):
         """Test _auth_qrcode raises AuthenticationError when token_login fails and no QR code available."""
-        auth = PronoteAuth()
-
         data = {
             "qr_code_url": "https://example.com",
             "qr_code_username": "user",
@@ -1239,22 +1121,19 @@ class TestPronoteAuthQRCode:
             "qr_code_uuid": "uuid123",
         }
 
-        with patch(
-            "custom_components.pronote.api.auth.pronotepy.Client.token_login", side_effect=Exception("Token failed")
-        ):
-            with pytest.raises(AuthenticationError, match="Token expiré"):
-                auth._auth_qrcode(data, "student")
+        monkeypatch.setattr(
+            "custom_components.pronote.api.auth.pronotepy.Client.token_login",
+            MagicMock(side_effect=Exception("Token failed")),
+        )
+        with pytest.raises(AuthenticationError) as exc_info:
+            pronote_auth._auth_qrcode(data, "student")
+        assert "Token expiré" in str(exc_info.value)
 
-    def test_auth_qrcode_token_login_failure_falls_back_to_qr_if_available(self):
+    def test_auth_qrcode_token_login_failure_falls_back_to_qr_if_available(
+        self, monkeypatch, pronote_auth, qr_mock_client
+    ):
         """Test _auth_qrcode falls back to qrcode_login when token_login fails and fresh QR code is available."""
-        auth = PronoteAuth()
-        mock_client = MagicMock()
-        mock_client.export_credentials.return_value = {
-            "pronote_url": "https://example.com",
-            "username": "user",
-            "password": "new_password",
-            "uuid": "uuid123",
-        }
+        mock_client = qr_mock_client
 
         data = {
             "qr_code_url": "https://example.com",
@@ -1265,136 +1144,62 @@ class TestPronoteAuthQRCode:
             "qr_code_pin": "1234",
         }
 
-        with patch(
-            "custom_components.pronote.api.auth.pronotepy.Client.token_login", side_effect=Exception("Token failed")
-        ):
-            with patch("custom_components.pronote.api.auth.pronotepy.Client.qrcode_login", return_value=mock_client):
-                client, creds = auth._auth_qrcode(data, "student")
+        monkeypatch.setattr(
+            "custom_components.pronote.api.auth.pronotepy.Client.token_login",
+            MagicMock(side_effect=Exception("Token failed")),
+        )
+        monkeypatch.setattr(
+            "custom_components.pronote.api.auth.pronotepy.Client.qrcode_login", MagicMock(return_value=mock_client)
+        )
+        client, creds = pronote_auth._auth_qrcode(data, "student")
 
         assert client == mock_client
 
-    def test_auth_qrcode_json_decode_error(self):
+    def test_auth_qrcode_json_decode_error(self, pronote_auth):
         """Test _auth_qrcode raises InvalidResponseError on JSON decode error."""
-        auth = PronoteAuth()
-
         data = {
             "qr_code_json": "invalid json",
             "qr_code_pin": "1234",
             "qr_code_uuid": "uuid123",
         }
 
-        with pytest.raises(InvalidResponseError, match="QR code JSON invalide"):
-            auth._auth_qrcode(data, "student")
+        with pytest.raises(InvalidResponseError) as exc_info:
+            pronote_auth._auth_qrcode(data, "student")
+        assert "QR code JSON invalide" in str(exc_info.value)
 
-    def test_auth_qrcode_missing_qr_code_json(self):
+    def test_auth_qrcode_missing_qr_code_json(self, pronote_auth):
         """Test _auth_qrcode raises AuthenticationError when no QR code JSON."""
-        auth = PronoteAuth()
-
         data = {}
 
-        with pytest.raises(AuthenticationError, match="Aucun QR code ou token sauvegardé"):
-            auth._auth_qrcode(data, "student")
+        with pytest.raises(AuthenticationError) as exc_info:
+            pronote_auth._auth_qrcode(data, "student")
+        assert "Aucun QR code ou token sauvegardé" in str(exc_info.value)
 
 
 class TestPronoteAuthAdditionalCoverage:
     """Additional tests to reach 95% coverage for auth.py."""
 
-    async def test_authenticate_session_check_failure_continues(self):
-        """Test authenticate continues even if session_check fails."""
-        auth = PronoteAuth()
-        mock_client = MagicMock()
-        mock_client.session_check.side_effect = Exception("Session check failed")
-        mock_creds = MagicMock()
-
-        with patch.object(auth, "_auth_username_password", return_value=(mock_client, mock_creds)):
-            client, creds = await auth.authenticate(
-                "username_password",
-                {
-                    "url": "https://example.com",
-                    "username": "test",
-                    "password": "pass",
-                },
-            )
-
-        assert client is mock_client
-        mock_client.session_check.assert_called_once()
-
-    def test_auth_username_password_with_ent(self):
+    def test_auth_username_password_with_ent(self, monkeypatch, pronote_auth, mock_pronote_client):
         """Test _auth_username_password with ENT specified."""
-        auth = PronoteAuth()
-
-        with patch("custom_components.pronote.api.auth.pronotepy") as mock_pronotepy:
-            mock_client = MagicMock()
-            mock_client.password = "testpass"
-            mock_client.export_credentials.return_value = {
-                "pronote_url": "https://example.com",
-                "username": "test",
-                "uuid": "uuid123",
-            }
-            mock_pronotepy.Client.return_value = mock_client
+        mock_client = mock_pronote_client
 
-            # Create ENT mock
-            mock_ent = MagicMock()
-            mock_pronotepy.ent = type("ENTModule", (), {"test_ent": mock_ent})()
+        mock_pronotepy = MagicMock()
+        monkeypatch.setattr("custom_components.pronote.api.auth.pronotepy", mock_pronotepy)
+        mock_pronotepy.Client.return_value = mock_client
 
-            client, creds = auth._auth_username_password(
-                {
-                    "url": "https://example.com",
-                    "username": "test",
-                    "password": "pass",
-                    "ent": "test_ent",
-                },
-                "student",
-            )
-
-            assert client is mock_client
-            assert creds.pronote_url == "https://example.com"
-
-    def test_auth_username_password_export_credentials_exception(self):
-        """Test _auth_username_password when export_credentials raises exception."""
-        auth = PronoteAuth()
-
-        with patch("custom_components.pronote.api.auth.pronotepy") as mock_pronotepy:
-            mock_client = MagicMock()
-            mock_client.export_credentials.side_effect = Exception("Export failed")
-            mock_pronotepy.Client.return_value = mock_client
-
-            client, creds = auth._auth_username_password(
-                {
-                    "url": "https://example.com/pronote/",
-                    "username": "test",
-                    "password": "pass",
-                },
-                "student",
-            )
+        # Create ENT mock
+        mock_ent = MagicMock()
+        mock_pronotepy.ent = type("ENTModule", (), {"test_ent": mock_ent})()
 
-            assert client is mock_client
-            assert "eleve.html" in creds.pronote_url
-            assert creds.username == "test"
-            assert creds.password == "pass"
-
-    def test_auth_username_password_cleans_account_pin(self):
-        """Test _auth_username_password cleans account_pin from client."""
-        auth = PronoteAuth()
-
-        with patch("custom_components.pronote.api.auth.pronotepy") as mock_pronotepy:
-            mock_client = MagicMock()
-            mock_client.account_pin = "1234"
-            mock_client.password = "testpass"
-            mock_client.export_credentials.return_value = {
-                "pronote_url": "https://example.com",
+        client, creds = pronote_auth._auth_username_password(
+            {
+                "url": "https://example.com",
                 "username": "test",
-            }
-            mock_pronotepy.Client.return_value = mock_client
-
-            client, creds = auth._auth_username_password(
-                {
-                    "url": "https://example.com",
-                    "username": "test",
-                    "password": "pass",
-                },
-                "student",
-            )
+                "password": "pass",
+                "ent": "test_ent",
+            },
+            "student",
+        )
 
-            assert client is mock_client
-            # Verify the code ran without error (coverage is what matters here)
+        assert client is mock_client
+        assert creds.pronote_url == "https://example.com"
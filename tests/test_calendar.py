@@ -1,12 +1,13 @@
 """Tests for the Pronote calendar module."""
 
-from datetime import datetime, timedelta
-from types import SimpleNamespace
+from datetime import UTC, datetime, timedelta
 from unittest.mock import MagicMock, patch
 from zoneinfo import ZoneInfo
 
 from homeassistant.util import dt as dt_util
 
+from custom_components.pronote import calendar as calendar_module
+from custom_components.pronote.api import ChildInfo
 from custom_components.pronote.calendar import (
     PronoteCalendar,
     async_get_calendar_event_from_lessons,
@@ -68,12 +69,18 @@ class TestAsyncGetCalendarEventFromLessons:
 
         assert event.start.tzinfo == ZoneInfo("America/New_York")
 
+    def test_utc_uses_builtin_timezone(self, mock_lesson):
+        lesson = mock_lesson(start=datetime(2025, 1, 15, 8, 0))
+        event = async_get_calendar_event_from_lessons(lesson, "Etc/UTC")
+
+        assert event.start.tzinfo is UTC
+
 
 class TestPronoteCalendar:
     def test_init_with_nickname(self, mock_lesson):
         """When nickname is set, calendar_name uses the nickname."""
         data = {
-            "child_info": SimpleNamespace(name="Jean Dupont"),
+            "child_info": ChildInfo(name="Jean Dupont"),
             "sensor_prefix": "jean_dupont",
         }
         coord = _make_coordinator(data=data, options={"nickname": "Jeanot"})
@@ -85,7 +92,7 @@ class TestPronoteCalendar:
     def test_init_without_nickname(self, mock_lesson):
         """When nickname is empty, calendar_name uses child_info.name."""
         data = {
-            "child_info": SimpleNamespace(name="Jean Dupont"),
+            "child_info": ChildInfo(name="Jean Dupont"),
             "sensor_prefix": "jean_dupont",
         }
         coord = _make_coordinator(data=data, options={"nickname": ""})
@@ -97,7 +104,7 @@ class TestPronoteCalendar:
     def test_unique_id(self):
         """Verify unique_id format is pronote_{sensor_prefix}_timetable."""
         data = {
-            "child_info": SimpleNamespace(name="Jean Dupont"),
+            "child_info": ChildInfo(name="Jean Dupont"),
             "sensor_prefix": "jean_dupont",
         }
         coord = _make_coordinator(data=data)
@@ -108,7 +115,7 @@ class TestPronoteCalendar:
     def test_event_property(self, mock_lesson):
         """The event property returns self._event."""
         data = {
-            "child_info": SimpleNamespace(name="Jean Dupont"),
+            "child_info": ChildInfo(name="Jean Dupont"),
             "sensor_prefix": "jean_dupont",
         }
         coord = _make_coordinator(data=data)
@@ -142,7 +149,7 @@ class TestHandleCoordinatorUpdate:
     def test_no_lessons(self):
         """When lessons_period is None, event is None."""
         data = {
-            "child_info": SimpleNamespace(name="Jean Dupont"),
+            "child_info": ChildInfo(name="Jean Dupont"),
             "sensor_prefix": "jean_dupont",
             "lessons_period": None,
         }
@@ -154,7 +161,7 @@ class TestHandleCoordinatorUpdate:
     def test_empty_lessons(self):
         """When lessons_period is an empty list, event is None."""
         data = {
-            "child_info": SimpleNamespace(name="Jean Dupont"),
+            "child_info": ChildInfo(name="Jean Dupont"),
             "sensor_prefix": "jean_dupont",
             "lessons_period": [],
         }
@@ -175,7 +182,7 @@ class TestHandleCoordinatorUpdate:
             room="B202",
         )
         data = {
-            "child_info": SimpleNamespace(name="Jean Dupont"),
+            "child_info": ChildInfo(name="Jean Dupont"),
             "sensor_prefix": "jean_dupont",
             "lessons_period": [lesson],
         }
@@ -185,6 +192,94 @@ class TestHandleCoordinatorUpdate:
         assert cal.event is not None
         assert cal.event.summary == "Français"
 
+    def test_current_event_kept_when_data_unchanged(self, mock_lesson):
+        """A second update with the same data reuses the running event."""
+        now = dt_util.now()
+        tz = ZoneInfo("Europe/Paris")
+        lesson = mock_lesson(
+            start=now.astimezone(tz).replace(tzinfo=None) - timedelta(minutes=10),
+            end=now.astimezone(tz).replace(tzinfo=None) + timedelta(minutes=50),
+        )
+        data = {
+            "child_info": ChildInfo(name="Jean Dupont"),
+            "sensor_prefix": "jean_dupont",
+            "lessons_period": [lesson],
+        }
+        cal = self._make_calendar(data)
+        cal._handle_coordinator_update()
+        first_event = cal.event
+
+        cal._handle_coordinator_update()
+
+        assert cal.event is first_event
+
+    def test_timezone_change_applies_without_restart(self, mock_lesson):
+        """Changing the Home Assistant timezone rebuilds the running event in the new zone."""
+        now = dt_util.now().astimezone(ZoneInfo("Europe/Paris")).replace(tzinfo=None)
+        lesson = mock_lesson(start=now - timedelta(minutes=10), end=now + timedelta(minutes=50))
+        data = {
+            "child_info": ChildInfo(name="Jean Dupont"),
+            "sensor_prefix": "jean_dupont",
+            "lessons_period": [lesson],
+        }
+        cal = self._make_calendar(data)
+        cal._handle_coordinator_update()
+
+        # Brussels shares Paris' UTC offset, so the same lesson is still running
+        cal.hass.config.time_zone = "Europe/Brussels"
+        cal._handle_coordinator_update()
+
+        assert cal.event.start.tzinfo == ZoneInfo("Europe/Brussels")
+
+    def test_overlapping_lessons(self, mock_lesson):
+        """A lesson still running wins over a shorter one that started after it and already ended."""
+        now = dt_util.now().astimezone(ZoneInfo("Europe/Paris")).replace(tzinfo=None)
+        long_lesson = mock_lesson(
+            subject_name="Maths",
+            start=now - timedelta(minutes=90),
+            end=now + timedelta(minutes=30),
+        )
+        short_lesson = mock_lesson(
+            subject_name="Français",
+            start=now - timedelta(minutes=60),
+            end=now - timedelta(minutes=30),
+        )
+        data = {
+            "child_info": ChildInfo(name="Jean Dupont"),
+            "sensor_prefix": "jean_dupont",
+            "lessons_period": [long_lesson, short_lesson],
+        }
+        cal = self._make_calendar(data)
+        cal._handle_coordinator_update()
+
+        assert cal.event is not None
+        assert cal.event.summary == "Maths"
+
+    def test_same_start_keeps_first_lesson(self, mock_lesson):
+        """When two lessons share a slot, the first one in the timetable is current."""
+        now = dt_util.now().astimezone(ZoneInfo("Europe/Paris")).replace(tzinfo=None)
+        canceled = mock_lesson(
+            subject_name="Maths",
+            start=now - timedelta(minutes=10),
+            end=now + timedelta(minutes=50),
+            canceled=True,
+        )
+        replacement = mock_lesson(
+            subject_name="Français",
+            start=now - timedelta(minutes=10),
+            end=now + timedelta(minutes=50),
+        )
+        data = {
+            "child_info": ChildInfo(name="Jean Dupont"),
+            "sensor_prefix": "jean_dupont",
+            "lessons_period": [canceled, replacement],
+        }
+        cal = self._make_calendar(data)
+        cal._handle_coordinator_update()
+
+        assert cal.event is not None
+        assert cal.event.summary == "Annulé - Maths"
+
     def test_no_current_event(self, mock_lesson):
         """When no lesson matches now, event is None."""
         past_lesson = mock_lesson(
@@ -196,7 +291,7 @@ class TestHandleCoordinatorUpdate:
             end=datetime(2099, 12, 31, 9, 0),
         )
         data = {
-            "child_info": SimpleNamespace(name="Jean Dupont"),
+            "child_info": ChildInfo(name="Jean Dupont"),
             "sensor_prefix": "jean_dupont",
             "lessons_period": [past_lesson, future_lesson],
         }
@@ -229,7 +324,7 @@ class TestAsyncGetEvents:
             end=datetime(2025, 2, 15, 9, 0),
         )
         data = {
-            "child_info": SimpleNamespace(name="Jean Dupont"),
+            "child_info": ChildInfo(name="Jean Dupont"),
             "sensor_prefix": "jean_dupont",
             "lessons_period": [in_range, out_of_range],
         }
@@ -248,10 +343,32 @@ class TestAsyncGetEvents:
         assert len(events) == 1
         assert events[0].summary == "Maths"
 
+    async def test_new_lessons_list_refreshes_events(self, mock_lesson):
+        """Replacing the lessons list is picked up even if the update time did not change."""
+        tz = ZoneInfo("Europe/Paris")
+        first = mock_lesson(subject_name="Maths", start=datetime(2025, 1, 15, 8, 0), end=datetime(2025, 1, 15, 9, 0))
+        second = mock_lesson(
+            subject_name="Français", start=datetime(2025, 1, 15, 10, 0), end=datetime(2025, 1, 15, 11, 0)
+        )
+        data = {
+            "child_info": ChildInfo(name="Jean Dupont"),
+            "sensor_prefix": "jean_dupont",
+            "lessons_period": [first],
+        }
+        cal = self._make_calendar(data)
+        start_date = datetime(2025, 1, 14, tzinfo=tz)
+        end_date = datetime(2025, 1, 16, tzinfo=tz)
+        await cal.async_get_events(cal.hass, start_date=start_date, end_date=end_date)
+
+        cal.coordinator.data = {**data, "lessons_period": [second]}
+        events = await cal.async_get_events(cal.hass, start_date=start_date, end_date=end_date)
+
+        assert [event.summary for event in events] == ["Français"]
+
     async def test_no_lessons(self):
         """When lessons_period is None, an empty list is returned."""
         data = {
-            "child_info": SimpleNamespace(name="Jean Dupont"),
+            "child_info": ChildInfo(name="Jean Dupont"),
             "sensor_prefix": "jean_dupont",
             "lessons_period": None,
         }
@@ -283,7 +400,7 @@ class TestAsyncGetEvents:
             canceled=True,
         )
         data = {
-            "child_info": SimpleNamespace(name="Jean Dupont"),
+            "child_info": ChildInfo(name="Jean Dupont"),
             "sensor_prefix": "jean_dupont",
             "lessons_period": [active, canceled],
         }
@@ -301,3 +418,25 @@ class TestAsyncGetEvents:
 
         assert len(events) == 1
         assert events[0].summary == "Maths"
+
+    async def test_canceled_lessons_not_built(self, mock_lesson):
+        """Canceled lessons are skipped before any CalendarEvent is built."""
+        active = mock_lesson(start=datetime(2025, 1, 15, 8, 0), end=datetime(2025, 1, 15, 9, 0))
+        canceled = mock_lesson(start=datetime(2025, 1, 15, 10, 0), end=datetime(2025, 1, 15, 11, 0), canceled=True)
+        data = {
+            "child_info": ChildInfo(name="Jean Dupont"),
+            "sensor_prefix": "jean_dupont",
+            "lessons_period": [active, canceled],
+        }
+        cal = self._make_calendar(data)
+
+        tz = ZoneInfo("Europe/Paris")
+        with patch("custom_components.pronote.calendar._build_event", wraps=calendar_module._build_event) as build:
+            await cal.async_get_events(
+                cal.hass,
+                start_date=datetime(2025, 1, 14, tzinfo=tz),
+                end_date=datetime(2025, 1, 16, tzinfo=tz),
+            )
+
+        assert build.call_count == 1
+        assert build.call_args.args[0] is active
@@ -1,528 +1,391 @@
 """Tests for the Pronote config flow with new API client."""
 
-from types import SimpleNamespace
-from unittest.mock import MagicMock, patch
+from collections.abc import Generator
+from types import MappingProxyType, SimpleNamespace
+from unittest.mock import AsyncMock, patch
 
+import pytest
 from homeassistant import config_entries
 from homeassistant.core import HomeAssistant
 from homeassistant.data_entry_flow import FlowResultType
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 from custom_components.pronote.api import AuthenticationError, PronoteAPIClient
+from custom_components.pronote.api.auth import PronoteAuth
+from custom_components.pronote.api.models import Credentials
 from custom_components.pronote.config_flow import (
     DOMAIN,
+    InvalidAuth,
 )
 
-UP_ELEVE_INPUT = {
-    "account_type": "eleve",
-    "url": "https://pronote.example.com/pronote/",
-    "username": "jean.dupont",
-    "password": "secret123",
-}
-
-QR_ELEVE_INPUT = {
-    "account_type": "eleve",
-    "qr_code_json": '{"url":"https://pronote.example.com"}',
-    "qr_code_pin": "1234",
-}
-
-
-def _make_eleve_client(name="Jean Dupont"):
-    """Return a mock pronote client for an 'eleve' account."""
-    client = MagicMock()
-    client.info = SimpleNamespace(name=name)
-    client.children = []
-    return client
-
-
-def _make_qr_client(name="Jean Dupont", is_parent=False, children_names=None):
-    """Return a mock pronote client for a QR-code login."""
-    client = MagicMock()
-    client.info = SimpleNamespace(name=name)
-    client.pronote_url = "https://pronote.example.com/pronote/eleve.html"
-    client.username = "qr_user"
-    client.password = "qr_pass"
-    client.uuid = "qr_uuid_1234"
-    if is_parent:
-        if children_names is None:
-            children_names = ["Jean Dupont", "Marie Dupont"]
-        client.children = [SimpleNamespace(name=n) for n in children_names]
-    else:
-        client.children = []
-    return client
-
-
-def _make_credentials():
-    """Return mock credentials for QR login."""
-    from custom_components.pronote.api.models import Credentials
-
-    return Credentials(
-        pronote_url="https://pronote.example.com/pronote/eleve.html",
-        username="qr_user",
-        password="qr_pass",
-        uuid="qr_uuid_1234",
-        client_identifier=None,
-    )
-
-
-async def test_step_user_shows_menu(hass: HomeAssistant) -> None:
-    """The initial user step should present a menu."""
-    result = await hass.config_entries.flow.async_init(DOMAIN, context={"source": config_entries.SOURCE_USER})
-    assert result["type"] is FlowResultType.MENU
-    assert "username_password_login" in result["menu_options"]
-    assert "qr_code_login" in result["menu_options"]
-
-
-async def test_up_login_eleve_success(hass: HomeAssistant) -> None:
-    """Successful eleve login via UP goes to nickname step."""
-    result = await hass.config_entries.flow.async_init(DOMAIN, context={"source": config_entries.SOURCE_USER})
-    result = await hass.config_entries.flow.async_configure(
-        result["flow_id"],
-        {"next_step_id": "username_password_login"},
-    )
+_CHILD_NAME = "Jean Dupont"
+_PARENT_TITLE = f"{_CHILD_NAME} (via compte parent)"
+
+# Read-only so no test can leak changes into another; pass a dict() copy to the flow
+UP_ELEVE_INPUT = MappingProxyType(
+    {
+        "account_type": "eleve",
+        "url": "https://pronote.example.com/pronote/",
+        "username": "jean.dupont",
+        "password": "secret123",
+    }
+)
 
-    mock_client = _make_eleve_client("Jean Dupont")
-    mock_creds = _make_credentials()
+QR_ELEVE_INPUT = MappingProxyType(
+    {
+        "account_type": "eleve",
+        "qr_code_json": '{"url":"https://pronote.example.com"}',
+        "qr_code_pin": "1234",
+    }
+)
 
-    with patch("custom_components.pronote.api.auth.PronoteAuth.authenticate", return_value=(mock_client, mock_creds)):
-        result = await hass.config_entries.flow.async_configure(
-            result["flow_id"],
-            UP_ELEVE_INPUT,
-        )
+UP_PARENT_INPUT = MappingProxyType(
+    {
+        "account_type": "parent",
+        "url": "https://pronote.example.com/pronote/",
+        "username": "parent.dupont",
+        "password": "secret123",
+    }
+)
 
-    assert result["type"] is FlowResultType.FORM
-    assert result["step_id"] == "nickname"
+QR_PARENT_INPUT = MappingProxyType(
+    {
+        "account_type": "parent",
+        "qr_code_json": '{"url":"https://pronote.example.com"}',
+        "qr_code_pin": "1234",
+    }
+)
 
 
-async def test_up_login_full_flow(hass: HomeAssistant) -> None:
-    """Full UP eleve flow."""
-    result = await hass.config_entries.flow.async_init(DOMAIN, context={"source": config_entries.SOURCE_USER})
-    result = await hass.config_entries.flow.async_configure(
-        result["flow_id"],
-        {"next_step_id": "username_password_login"},
-    )
+# Existing entries; copied per test since MockConfigEntry keeps the dict it is given
+_UP_ENTRY_DATA = MappingProxyType(
+    {
+        "connection_type": "username_password",
+        "account_type": "eleve",
+        "url": "https://pronote.example.com/pronote/",
+        "username": "jean.dupont",
+        "password": "old_password",
+    }
+)
 
-    mock_client = _make_eleve_client("Jean Dupont")
-    mock_creds = _make_credentials()
+_QR_ENTRY_DATA = MappingProxyType(
+    {
+        "connection_type": "qrcode",
+        "account_type": "eleve",
+        "qr_code_json": '{"old":"data"}',
+        "qr_code_pin": "0000",
+        "qr_code_url": "https://pronote.example.com/pronote/eleve.html",
+        "qr_code_username": "old_user",
+        "qr_code_password": "old_pass",
+        "qr_code_uuid": "old_uuid",
+    }
+)
 
-    with patch("custom_components.pronote.api.auth.PronoteAuth.authenticate", return_value=(mock_client, mock_creds)):
-        result = await hass.config_entries.flow.async_configure(
-            result["flow_id"],
-            UP_ELEVE_INPUT,
-        )
 
-    assert result["step_id"] == "nickname"
+@pytest.fixture(autouse=True)
+def mock_setup_entry() -> Generator[AsyncMock]:
+    """Keep created and reloaded entries from setting up the integration."""
+    with (
+        patch("custom_components.pronote.async_setup_entry", return_value=True) as mock_setup,
+        patch("custom_components.pronote.async_unload_entry", return_value=True),
+    ):
+        yield mock_setup
 
-    result = await hass.config_entries.flow.async_configure(
-        result["flow_id"],
-        {"nickname": "Jean"},
-    )
 
-    assert result["type"] is FlowResultType.CREATE_ENTRY
-    assert result["title"] == "Jean Dupont"
-    assert result["data"]["connection_type"] == "username_password"
+# The config flow only reads the children, so parent clients share this tuple
+_PARENT_CHILDREN = (SimpleNamespace(name=_CHILD_NAME), SimpleNamespace(name="Marie Dupont"))
 
 
-async def test_up_login_invalid_auth(hass: HomeAssistant) -> None:
-    """Invalid auth shows error."""
-    result = await hass.config_entries.flow.async_init(DOMAIN, context={"source": config_entries.SOURCE_USER})
-    result = await hass.config_entries.flow.async_configure(
-        result["flow_id"],
-        {"next_step_id": "username_password_login"},
-    )
+def _make_eleve_client(name=_CHILD_NAME, is_parent=False):
+    """Return a stand-in pronote client for a username/password login."""
+    return SimpleNamespace(info=SimpleNamespace(name=name), children=_PARENT_CHILDREN if is_parent else ())
 
-    with patch.object(PronoteAPIClient, "authenticate", side_effect=AuthenticationError("Invalid credentials")):
-        result = await hass.config_entries.flow.async_configure(
-            result["flow_id"],
-            UP_ELEVE_INPUT,
-        )
 
-    assert result["type"] is FlowResultType.FORM
-    assert result["errors"]["base"] == "invalid_auth"
-
-
-async def test_qr_login_eleve_success(hass: HomeAssistant) -> None:
-    """Successful eleve QR login goes to nickname step."""
-    result = await hass.config_entries.flow.async_init(DOMAIN, context={"source": config_entries.SOURCE_USER})
-    result = await hass.config_entries.flow.async_configure(
-        result["flow_id"],
-        {"next_step_id": "qr_code_login"},
+def _make_qr_client(name=_CHILD_NAME, is_parent=False):
+    """Return a stand-in pronote client for a QR-code login."""
+    return SimpleNamespace(
+        info=SimpleNamespace(name=name),
+        pronote_url="https://pronote.example.com/pronote/eleve.html",
+        username="qr_user",
+        password="qr_pass",
+        uuid="qr_uuid_1234",
+        children=_PARENT_CHILDREN if is_parent else (),
     )
 
-    mock_client = _make_qr_client("Jean Dupont")
-    mock_creds = _make_credentials()
 
-    with patch("custom_components.pronote.api.auth.PronoteAuth.authenticate", return_value=(mock_client, mock_creds)):
-        result = await hass.config_entries.flow.async_configure(
-            result["flow_id"],
-            QR_ELEVE_INPUT,
-        )
+def _mock_auth(monkeypatch: pytest.MonkeyPatch, client, creds) -> None:
+    """Make PronoteAuth.authenticate return the given client and credentials."""
 
-    assert result["type"] is FlowResultType.FORM
-    assert result["step_id"] == "nickname"
+    async def _authenticate(self, connection_type, config_data):
+        return client, creds
 
+    monkeypatch.setattr(PronoteAuth, "authenticate", _authenticate)
 
-async def test_qr_login_full_flow(hass: HomeAssistant) -> None:
-    """Full QR eleve flow."""
-    result = await hass.config_entries.flow.async_init(DOMAIN, context={"source": config_entries.SOURCE_USER})
-    result = await hass.config_entries.flow.async_configure(
-        result["flow_id"],
-        {"next_step_id": "qr_code_login"},
-    )
 
-    mock_client = _make_qr_client("Jean Dupont")
-    mock_creds = _make_credentials()
+def _fail_auth(monkeypatch: pytest.MonkeyPatch, error: Exception) -> None:
+    """Make PronoteAPIClient.authenticate raise the given error."""
 
-    with patch("custom_components.pronote.api.auth.PronoteAuth.authenticate", return_value=(mock_client, mock_creds)):
-        result = await hass.config_entries.flow.async_configure(
-            result["flow_id"],
-            QR_ELEVE_INPUT,
-        )
+    async def _authenticate(self, connection_type, config_data):
+        raise error
 
-    assert result["step_id"] == "nickname"
+    monkeypatch.setattr(PronoteAPIClient, "authenticate", _authenticate)
 
-    result = await hass.config_entries.flow.async_configure(
-        result["flow_id"],
-        {"nickname": "Jean"},
-    )
 
-    assert result["type"] is FlowResultType.CREATE_ENTRY
-    assert result["title"] == "Jean Dupont"
-    assert result["data"]["connection_type"] == "qrcode"
-    # Verify QR credentials were saved
-    assert result["data"]["qr_code_url"] == "https://pronote.example.com/pronote/eleve.html"
-    assert result["data"]["qr_code_username"] == "qr_user"
-    assert result["data"]["qr_code_password"] == "qr_pass"
-    assert result["data"]["qr_code_uuid"] == "qr_uuid_1234"
+# Read-only: the flow only reads these, so one instance serves every test
+_CREDS = Credentials(
+    pronote_url="https://pronote.example.com/pronote/eleve.html",
+    username="qr_user",
+    password="qr_pass",
+    uuid="qr_uuid_1234",
+    client_identifier=None,
+)
+# The flow never mutates a client, so the student ones are shared too
+_ELEVE_CLIENT = _make_eleve_client(_CHILD_NAME)
+_QR_CLIENT = _make_qr_client(_CHILD_NAME)
 
 
-async def test_qr_login_invalid_auth(hass: HomeAssistant) -> None:
-    """QR login with invalid auth shows error."""
+async def _start_flow(hass: HomeAssistant, menu_choice: str) -> dict:
+    """Start a user flow and pick a login method from the menu."""
     result = await hass.config_entries.flow.async_init(DOMAIN, context={"source": config_entries.SOURCE_USER})
-    result = await hass.config_entries.flow.async_configure(
-        result["flow_id"],
-        {"next_step_id": "qr_code_login"},
-    )
-
-    with patch.object(PronoteAPIClient, "authenticate", side_effect=AuthenticationError("Invalid QR code")):
-        result = await hass.config_entries.flow.async_configure(
-            result["flow_id"],
-            QR_ELEVE_INPUT,
-        )
-
+    result = await hass.config_entries.flow.async_configure(result["flow_id"], {"next_step_id": menu_choice})
     assert result["type"] is FlowResultType.FORM
-    assert result["errors"]["base"] == "invalid_auth"
+    assert result["step_id"] == menu_choice
+    return result
 
 
-async def test_reauth_up_success(hass: HomeAssistant) -> None:
-    """Successful UP reauth updates the entry."""
-    entry = MockConfigEntry(
-        domain=DOMAIN,
-        data={
-            "connection_type": "username_password",
-            "account_type": "eleve",
-            "url": "https://pronote.example.com/pronote/",
-            "username": "jean.dupont",
-            "password": "old_password",
-        },
-        unique_id="Jean Dupont",
-        version=2,
-    )
-    entry.add_to_hass(hass)
-
-    result = await entry.start_reauth_flow(hass)
-
-    mock_client = _make_eleve_client("Jean Dupont")
-    mock_creds = _make_credentials()
-
-    with patch("custom_components.pronote.api.auth.PronoteAuth.authenticate", return_value=(mock_client, mock_creds)):
-        result = await hass.config_entries.flow.async_configure(
-            result["flow_id"],
-            {"password": "new_password"},
-        )
-
-    assert result["type"] is FlowResultType.ABORT
-    assert result["reason"] == "reauth_successful"
-    assert entry.data["password"] == "new_password"
-
-
-async def test_reauth_up_invalid_auth(hass: HomeAssistant) -> None:
-    """Failed UP reauth shows error."""
-    entry = MockConfigEntry(
-        domain=DOMAIN,
-        data={
-            "connection_type": "username_password",
-            "account_type": "eleve",
-            "url": "https://pronote.example.com/pronote/",
-            "username": "jean.dupont",
-            "password": "old_password",
-        },
-        unique_id="Jean Dupont",
-        version=2,
-    )
-    entry.add_to_hass(hass)
+async def _flow_at_nickname(
+    hass: HomeAssistant, monkeypatch: pytest.MonkeyPatch, *, is_qr: bool = False, is_parent: bool = False
+) -> dict:
+    """Drive a successful login (and child selection for parents) up to the nickname step."""
+    if is_qr:
+        client = _make_qr_client("Parent Account", is_parent=True) if is_parent else _QR_CLIENT
+        user_input = QR_PARENT_INPUT if is_parent else QR_ELEVE_INPUT
+    else:
+        client = _make_eleve_client("Parent Account", is_parent=True) if is_parent else _ELEVE_CLIENT
+        user_input = UP_PARENT_INPUT if is_parent else UP_ELEVE_INPUT
 
-    result = await entry.start_reauth_flow(hass)
+    result = await _start_flow(hass, "qr_code_login" if is_qr else "username_password_login")
+    _mock_auth(monkeypatch, client, _CREDS)
+    result = await hass.config_entries.flow.async_configure(result["flow_id"], dict(user_input))
 
-    with patch.object(PronoteAPIClient, "authenticate", side_effect=AuthenticationError("Invalid credentials")):
-        result = await hass.config_entries.flow.async_configure(
-            result["flow_id"],
-            {"password": "wrong_password"},
-        )
+    if is_parent:
+        # Parent accounts pick the child first
+        assert result["type"] is FlowResultType.FORM
+        assert result["step_id"] == "parent"
+        result = await hass.config_entries.flow.async_configure(result["flow_id"], {"child": _CHILD_NAME})
 
     assert result["type"] is FlowResultType.FORM
-    assert result["step_id"] == "reauth_confirm"
-    assert result["errors"]["base"] == "invalid_auth"
+    assert result["step_id"] == "nickname"
+    return result
 
 
-async def test_reauth_qr_success(hass: HomeAssistant) -> None:
-    """Successful QR reauth updates credentials."""
+async def _start_reauth(hass: HomeAssistant, data: MappingProxyType) -> tuple[MockConfigEntry, dict]:
+    """Register a config entry built from data and start its reauth flow."""
     entry = MockConfigEntry(
         domain=DOMAIN,
-        data={
-            "connection_type": "qrcode",
-            "account_type": "eleve",
-            "qr_code_json": '{"old":"data"}',
-            "qr_code_pin": "0000",
-            "qr_code_url": "https://pronote.example.com/pronote/eleve.html",
-            "qr_code_username": "old_user",
-            "qr_code_password": "old_pass",
-            "qr_code_uuid": "old_uuid",
-        },
-        unique_id="Jean Dupont",
+        data=dict(data),
+        unique_id=_CHILD_NAME,
         version=2,
     )
     entry.add_to_hass(hass)
+    return entry, await entry.start_reauth_flow(hass)
 
-    result = await entry.start_reauth_flow(hass)
 
-    mock_client = _make_qr_client("Jean Dupont")
-    mock_creds = _make_credentials()
+@pytest.fixture
+async def up_reauth_flow(hass: HomeAssistant) -> tuple[MockConfigEntry, dict]:
+    """Return a username/password entry with its reauth flow started."""
+    return await _start_reauth(hass, _UP_ENTRY_DATA)
 
-    with patch("custom_components.pronote.api.auth.PronoteAuth.authenticate", return_value=(mock_client, mock_creds)):
-        result = await hass.config_entries.flow.async_configure(
-            result["flow_id"],
-            {
-                "qr_code_json": '{"new":"data"}',
-                "qr_code_pin": "9999",
-            },
-        )
 
-    assert result["type"] is FlowResultType.ABORT
-    assert result["reason"] == "reauth_successful"
-    assert entry.data["qr_code_password"] == "qr_pass"
-
-
-# Additional tests for coverage
+@pytest.fixture
+async def qr_reauth_flow(hass: HomeAssistant) -> tuple[MockConfigEntry, dict]:
+    """Return a QR code entry with its reauth flow started."""
+    return await _start_reauth(hass, _QR_ENTRY_DATA)
 
-UP_PARENT_INPUT = {
-    "account_type": "parent",
-    "url": "https://pronote.example.com/pronote/",
-    "username": "parent.dupont",
-    "password": "secret123",
-}
 
-QR_PARENT_INPUT = {
-    "account_type": "parent",
-    "qr_code_json": '{"url":"https://pronote.example.com"}',
-    "qr_code_pin": "1234",
-}
-
-
-async def test_up_login_parent_success(hass: HomeAssistant) -> None:
-    """Successful parent login via UP goes to parent step then nickname."""
+async def test_step_user_shows_menu(hass: HomeAssistant) -> None:
+    """The initial user step should present a menu."""
     result = await hass.config_entries.flow.async_init(DOMAIN, context={"source": config_entries.SOURCE_USER})
-    result = await hass.config_entries.flow.async_configure(
-        result["flow_id"],
-        {"next_step_id": "username_password_login"},
-    )
-
-    mock_client = _make_eleve_client("Parent Account")
-    mock_client.children = [SimpleNamespace(name="Jean Dupont"), SimpleNamespace(name="Marie Dupont")]
-    mock_creds = _make_credentials()
-
-    with patch("custom_components.pronote.api.auth.PronoteAuth.authenticate", return_value=(mock_client, mock_creds)):
-        result = await hass.config_entries.flow.async_configure(
-            result["flow_id"],
-            UP_PARENT_INPUT,
-        )
-
-    # Should go to parent step to select child
-    assert result["type"] is FlowResultType.FORM
-    assert result["step_id"] == "parent"
+    assert result["type"] is FlowResultType.MENU
+    assert "username_password_login" in result["menu_options"]
+    assert "qr_code_login" in result["menu_options"]
 
-    # Select child
-    result = await hass.config_entries.flow.async_configure(
-        result["flow_id"],
-        {"child": "Jean Dupont"},
-    )
 
-    # Should go to nickname step
-    assert result["type"] is FlowResultType.FORM
-    assert result["step_id"] == "nickname"
+@pytest.mark.parametrize(
+    ("is_qr", "is_parent", "expected_title", "expected_conn"),
+    [
+        (False, False, _CHILD_NAME, "username_password"),
+        (True, False, _CHILD_NAME, "qrcode"),
+        (False, True, _PARENT_TITLE, "username_password"),
+        (True, True, _PARENT_TITLE, "qrcode"),
+    ],
+    ids=["up_eleve", "qr_eleve", "up_parent", "qr_parent"],
+)
+async def test_login_full_flow(
+    hass: HomeAssistant,
+    monkeypatch: pytest.MonkeyPatch,
+    mock_setup_entry: AsyncMock,
+    is_qr: bool,
+    is_parent: bool,
+    expected_title: str,
+    expected_conn: str,
+) -> None:
+    """Every login path (UP/QR, eleve/parent) ends with a created entry."""
+    result = await _flow_at_nickname(hass, monkeypatch, is_qr=is_qr, is_parent=is_parent)
 
-    # Set nickname and complete
     result = await hass.config_entries.flow.async_configure(
         result["flow_id"],
         {"nickname": "Jean"},
     )
+    await hass.async_block_till_done()
 
     assert result["type"] is FlowResultType.CREATE_ENTRY
-    assert "Jean Dupont (via compte parent)" in result["title"]
-
-
-async def test_qr_login_parent_success(hass: HomeAssistant) -> None:
-    """Successful parent login via QR goes to parent step then nickname."""
-    result = await hass.config_entries.flow.async_init(DOMAIN, context={"source": config_entries.SOURCE_USER})
+    assert result["title"] == expected_title
+    assert result["data"]["connection_type"] == expected_conn
+    assert result["result"].source == config_entries.SOURCE_USER
+    mock_setup_entry.assert_called_once()
+    if is_qr:
+        # Verify QR credentials were saved
+        assert result["data"]["qr_code_url"] == "https://pronote.example.com/pronote/eleve.html"
+        assert result["data"]["qr_code_username"] == "qr_user"
+        assert result["data"]["qr_code_password"] == "qr_pass"
+        assert result["data"]["qr_code_uuid"] == "qr_uuid_1234"
+
+
+@pytest.mark.parametrize(
+    ("menu_choice", "user_input", "error"),
+    [
+        ("username_password_login", UP_ELEVE_INPUT, AuthenticationError("Invalid credentials")),
+        ("username_password_login", UP_ELEVE_INPUT, InvalidAuth()),
+        ("username_password_login", UP_ELEVE_INPUT, RuntimeError("Unexpected")),
+        ("qr_code_login", QR_ELEVE_INPUT, AuthenticationError("Invalid QR code")),
+        ("qr_code_login", QR_ELEVE_INPUT, InvalidAuth()),
+        ("qr_code_login", QR_ELEVE_INPUT, RuntimeError("Unexpected")),
+    ],
+    ids=["up_auth_error", "up_invalid_auth", "up_generic", "qr_auth_error", "qr_invalid_auth", "qr_generic"],
+)
+async def test_login_invalid_auth(
+    hass: HomeAssistant,
+    monkeypatch: pytest.MonkeyPatch,
+    menu_choice: str,
+    user_input: MappingProxyType,
+    error: Exception,
+) -> None:
+    """Any authentication failure shows the invalid_auth error on the login form."""
+    result = await _start_flow(hass, menu_choice)
+
+    _fail_auth(monkeypatch, error)
     result = await hass.config_entries.flow.async_configure(
         result["flow_id"],
-        {"next_step_id": "qr_code_login"},
+        dict(user_input),
     )
 
-    mock_client = _make_qr_client("Parent Account", is_parent=True)
-    mock_creds = _make_credentials()
+    assert result["type"] is FlowResultType.FORM
+    assert result["errors"]["base"] == "invalid_auth"
 
-    with patch("custom_components.pronote.api.auth.PronoteAuth.authenticate", return_value=(mock_client, mock_creds)):
-        result = await hass.config_entries.flow.async_configure(
-            result["flow_id"],
-            QR_PARENT_INPUT,
-        )
 
-    # Should go to parent step to select child
-    assert result["type"] is FlowResultType.FORM
-    assert result["step_id"] == "parent"
+async def test_reauth_up_success(hass: HomeAssistant, monkeypatch: pytest.MonkeyPatch, up_reauth_flow: tuple) -> None:
+    """Successful UP reauth updates the entry."""
+    entry, result = up_reauth_flow
 
-    # Select child
+    _mock_auth(monkeypatch, _ELEVE_CLIENT, _CREDS)
     result = await hass.config_entries.flow.async_configure(
         result["flow_id"],
-        {"child": "Jean Dupont"},
+        {"password": "new_password"},
     )
 
-    # Should go to nickname step
-    assert result["type"] is FlowResultType.FORM
-    assert result["step_id"] == "nickname"
-
+    assert result["type"] is FlowResultType.ABORT
+    assert result["reason"] == "reauth_successful"
+    assert entry.data["password"] == "new_password"
 
-async def test_up_login_invalid_auth_exception(hass: HomeAssistant) -> None:
-    """InvalidAuth exception shows error."""
-    from custom_components.pronote.config_flow import InvalidAuth
 
-    result = await hass.config_entries.flow.async_init(DOMAIN, context={"source": config_entries.SOURCE_USER})
-    result = await hass.config_entries.flow.async_configure(
-        result["flow_id"],
-        {"next_step_id": "username_password_login"},
-    )
+_REAUTH_FAILURES = pytest.mark.parametrize(
+    ("error", "expected_error"),
+    [
+        (AuthenticationError("Invalid credentials"), "invalid_auth"),
+        (InvalidAuth(), "invalid_auth"),
+        (RuntimeError("Unexpected"), "unknown"),
+    ],
+    ids=["auth_error", "invalid_auth", "generic"],
+)
 
-    with patch.object(PronoteAPIClient, "authenticate", side_effect=InvalidAuth()):
-        result = await hass.config_entries.flow.async_configure(
-            result["flow_id"],
-            UP_ELEVE_INPUT,
-        )
 
-    assert result["type"] is FlowResultType.FORM
-    assert result["errors"]["base"] == "invalid_auth"
+@_REAUTH_FAILURES
+async def test_reauth_up_failure(
+    hass: HomeAssistant,
+    monkeypatch: pytest.MonkeyPatch,
+    up_reauth_flow: tuple,
+    error: Exception,
+    expected_error: str,
+) -> None:
+    """Failed UP reauth keeps the form open with the matching error."""
+    entry, result = up_reauth_flow
 
-
-async def test_up_login_generic_exception(hass: HomeAssistant) -> None:
-    """Generic exception shows error."""
-    result = await hass.config_entries.flow.async_init(DOMAIN, context={"source": config_entries.SOURCE_USER})
+    _fail_auth(monkeypatch, error)
     result = await hass.config_entries.flow.async_configure(
         result["flow_id"],
-        {"next_step_id": "username_password_login"},
+        {"password": "wrong_password"},
     )
 
-    with patch.object(PronoteAPIClient, "authenticate", side_effect=RuntimeError("Unexpected")):
-        result = await hass.config_entries.flow.async_configure(
-            result["flow_id"],
-            UP_ELEVE_INPUT,
-        )
-
     assert result["type"] is FlowResultType.FORM
-    assert result["errors"]["base"] == "invalid_auth"
+    assert result["step_id"] == "reauth_confirm"
+    assert result["errors"]["base"] == expected_error
+    assert entry.data["password"] == "old_password"
 
 
-async def test_qr_login_invalid_auth_exception(hass: HomeAssistant) -> None:
-    """QR login with InvalidAuth exception shows error."""
-    from custom_components.pronote.config_flow import InvalidAuth
+async def test_reauth_qr_success(hass: HomeAssistant, monkeypatch: pytest.MonkeyPatch, qr_reauth_flow: tuple) -> None:
+    """Successful QR reauth updates credentials."""
+    entry, result = qr_reauth_flow
 
-    result = await hass.config_entries.flow.async_init(DOMAIN, context={"source": config_entries.SOURCE_USER})
+    _mock_auth(monkeypatch, _QR_CLIENT, _CREDS)
     result = await hass.config_entries.flow.async_configure(
         result["flow_id"],
-        {"next_step_id": "qr_code_login"},
+        {
+            "qr_code_json": '{"new":"data"}',
+            "qr_code_pin": "9999",
+        },
     )
 
-    with patch.object(PronoteAPIClient, "authenticate", side_effect=InvalidAuth()):
-        result = await hass.config_entries.flow.async_configure(
-            result["flow_id"],
-            QR_ELEVE_INPUT,
-        )
-
-    assert result["type"] is FlowResultType.FORM
-    assert result["errors"]["base"] == "invalid_auth"
-
+    assert result["type"] is FlowResultType.ABORT
+    assert result["reason"] == "reauth_successful"
+    assert entry.data["qr_code_password"] == "qr_pass"
 
-async def test_qr_login_generic_exception(hass: HomeAssistant) -> None:
-    """QR login with generic exception shows error."""
-    result = await hass.config_entries.flow.async_init(DOMAIN, context={"source": config_entries.SOURCE_USER})
-    result = await hass.config_entries.flow.async_configure(
-        result["flow_id"],
-        {"next_step_id": "qr_code_login"},
-    )
 
-    with patch.object(PronoteAPIClient, "authenticate", side_effect=RuntimeError("Unexpected")):
-        result = await hass.config_entries.flow.async_configure(
-            result["flow_id"],
-            QR_ELEVE_INPUT,
-        )
+# Additional tests for coverage
 
-    assert result["type"] is FlowResultType.FORM
-    assert result["errors"]["base"] == "invalid_auth"
 
+@_REAUTH_FAILURES
+async def test_reauth_qr_failure(
+    hass: HomeAssistant,
+    monkeypatch: pytest.MonkeyPatch,
+    qr_reauth_flow: tuple,
+    error: Exception,
+    expected_error: str,
+) -> None:
+    """Failed QR reauth keeps the form open with the matching error."""
+    entry, result = qr_reauth_flow
 
-async def test_reauth_qr_invalid_auth(hass: HomeAssistant) -> None:
-    """Failed QR reauth shows error."""
-    entry = MockConfigEntry(
-        domain=DOMAIN,
-        data={
-            "connection_type": "qrcode",
-            "account_type": "eleve",
-            "qr_code_json": '{"old":"data"}',
-            "qr_code_pin": "0000",
+    _fail_auth(monkeypatch, error)
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"],
+        {
+            "qr_code_json": '{"new":"data"}',
+            "qr_code_pin": "9999",
         },
-        unique_id="Jean Dupont",
-        version=2,
     )
-    entry.add_to_hass(hass)
-
-    result = await entry.start_reauth_flow(hass)
-
-    with patch.object(PronoteAPIClient, "authenticate", side_effect=AuthenticationError("Invalid QR")):
-        result = await hass.config_entries.flow.async_configure(
-            result["flow_id"],
-            {
-                "qr_code_json": '{"new":"data"}',
-                "qr_code_pin": "9999",
-            },
-        )
 
     assert result["type"] is FlowResultType.FORM
     assert result["step_id"] == "reauth_confirm"
-    assert result["errors"]["base"] == "invalid_auth"
+    assert result["errors"]["base"] == expected_error
 
 
 async def test_options_flow(hass: HomeAssistant) -> None:
     """Test options flow."""
     entry = MockConfigEntry(
         domain=DOMAIN,
-        data={
-            "connection_type": "username_password",
-            "account_type": "eleve",
-            "url": "https://pronote.example.com/pronote/",
-            "username": "jean.dupont",
-            "password": "secret123",
-        },
+        data=dict(_UP_ENTRY_DATA),
         options={"nickname": "Jean", "refresh_interval": 15},
-        unique_id="Jean Dupont",
+        unique_id=_CHILD_NAME,
         version=2,
     )
     entry.add_to_hass(hass)
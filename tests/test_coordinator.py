@@ -82,7 +82,12 @@ class TestPronoteDataUpdateCoordinator:
             coord._previous_period_cache_date = None
         return coord
 
-    @pytest.mark.asyncio
+    def test_unique_id_prefix(self, mock_coordinator):
+        """The entity unique_id prefix is built from the sensor prefix."""
+        mock_coordinator.data = {"sensor_prefix": "test_student"}
+
+        assert mock_coordinator.unique_id_prefix == "pronote_test_student_"
+
     async def test_async_update_data_success(self, mock_coordinator):
         """Test successful data update."""
         mock_pronote_data = MagicMock()
@@ -126,7 +131,6 @@ class TestPronoteDataUpdateCoordinator:
         mock_coordinator._api_client.authenticate.assert_not_called()
         mock_coordinator._api_client.fetch_all_data.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_async_update_data_auth_error(self, mock_coordinator):
         """Test authentication error handling."""
         from custom_components.pronote.api import AuthenticationError
@@ -140,7 +144,6 @@ class TestPronoteDataUpdateCoordinator:
 
         mock_create.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_async_update_data_rate_limit(self, mock_coordinator):
         """Test rate limit error handling."""
         from custom_components.pronote.api import RateLimitError
@@ -154,7 +157,6 @@ class TestPronoteDataUpdateCoordinator:
 
         mock_create.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_async_update_data_circuit_breaker_open(self, mock_coordinator):
         """Test circuit breaker open error handling."""
         from custom_components.pronote.api import CircuitBreakerOpenError
@@ -165,7 +167,6 @@ class TestPronoteDataUpdateCoordinator:
         with pytest.raises(UpdateFailed, match="temporarily unavailable"):
             await mock_coordinator._async_update_data()
 
-    @pytest.mark.asyncio
     async def test_async_update_data_connection_error(self, mock_coordinator):
         """Test connection error handling during auth."""
         from custom_components.pronote.api import ConnectionError
@@ -179,7 +180,6 @@ class TestPronoteDataUpdateCoordinator:
 
         mock_create.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_async_update_data_not_authenticated(self, mock_coordinator):
         """Test when client is not authenticated after auth attempt."""
         mock_coordinator._api_client.is_authenticated.return_value = False
@@ -191,7 +191,6 @@ class TestPronoteDataUpdateCoordinator:
 
         mock_create.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_async_update_data_fetch_rate_limit(self, mock_coordinator):
         """Test rate limit during fetch."""
         from custom_components.pronote.api import RateLimitError
@@ -206,7 +205,6 @@ class TestPronoteDataUpdateCoordinator:
 
         mock_create.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_async_update_data_no_child_info(self, mock_coordinator):
         """Test when no child info is returned."""
         mock_pronote_data = MagicMock()
@@ -491,7 +489,6 @@ class TestCoordinatorAdditionalCoverage:
             coord._previous_period_cache_date = None
         return coord
 
-    @pytest.mark.asyncio
     async def test_async_update_data_invalid_response_error(self, mock_coordinator):
         """Test InvalidResponseError handling during fetch."""
         from custom_components.pronote.api import InvalidResponseError
@@ -503,7 +500,6 @@ class TestCoordinatorAdditionalCoverage:
             with pytest.raises(UpdateFailed, match="Invalid response"):
                 await mock_coordinator._async_update_data()
 
-    @pytest.mark.asyncio
     async def test_async_update_data_connection_error_during_fetch(self, mock_coordinator):
         """Test ConnectionError handling during fetch."""
         from custom_components.pronote.api import ConnectionError
@@ -518,7 +514,6 @@ class TestCoordinatorAdditionalCoverage:
 
         mock_create.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_async_update_data_generic_exception_during_fetch(self, mock_coordinator):
         """Test generic Exception handling during fetch."""
         mock_coordinator._api_client.is_authenticated.return_value = True
@@ -528,7 +523,6 @@ class TestCoordinatorAdditionalCoverage:
             with pytest.raises(UpdateFailed, match="Error fetching data"):
                 await mock_coordinator._async_update_data()
 
-    @pytest.mark.asyncio
     async def test_async_update_data_auth_error_during_fetch(self, mock_coordinator):
         """Test AuthenticationError during fetch triggers reset and UpdateFailed (not ConfigEntryAuthFailed)."""
         from custom_components.pronote.api import AuthenticationError
@@ -542,7 +536,6 @@ class TestCoordinatorAdditionalCoverage:
 
         mock_coordinator._api_client.reset.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_async_update_data_saves_qr_credentials_after_auth(self, mock_coordinator):
         """Test QR code credentials are saved immediately after successful auth."""
         from custom_components.pronote.api.models import Credentials
@@ -622,7 +615,6 @@ class TestCoordinatorAdditionalCoverage:
         assert "qr_code_json" not in call_kwargs["data"]
         assert "qr_code_pin" not in call_kwargs["data"]
 
-    @pytest.mark.asyncio
     async def test_check_token_drift_detects_silent_rotation(self, mock_coordinator):
         """Test _check_token_drift detects when pronotepy silently rotates the token."""
         mock_pronote_data = MagicMock()
@@ -698,7 +690,6 @@ class TestCoordinatorAdditionalCoverage:
         last_call_kwargs = mock_update.call_args[1]
         assert last_call_kwargs["data"]["qr_code_password"] == "silently_rotated_token"
 
-    @pytest.mark.asyncio
     async def test_check_token_drift_no_drift_no_update(self, mock_coordinator):
         """Test _check_token_drift does nothing when password hasn't changed."""
         mock_pronote_data = MagicMock()
@@ -753,7 +744,6 @@ class TestCoordinatorAdditionalCoverage:
         # No drift → no update call
         mock_update.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_async_update_data_with_previous_period_data(self, mock_coordinator):
         """Test previous period data is added to the result."""
         mock_pronote_data = MagicMock()
@@ -4,7 +4,6 @@ from datetime import date, datetime, timedelta
 from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
-import pytest
 from slugify import slugify
 
 from custom_components.pronote.const import (
@@ -1207,7 +1206,6 @@ class TestPronotePeriodRelatedSensor:
 
 
 class TestAsyncSetupEntry:
-    @pytest.mark.asyncio
     async def test_creates_all_sensors(self):
         """Verify async_setup_entry creates the expected number of sensors with no previous periods."""
         coord = _make_coordinator()
@@ -1242,7 +1240,6 @@ class TestAsyncSetupEntry:
         # Total: 22
         assert len(sensors) == 22
 
-    @pytest.mark.asyncio
     async def test_creates_previous_period_sensors(self):
         """With 1 previous period, verify additional sensors are created (7 per period)."""
         coord = _make_coordinator()
@@ -1276,7 +1273,6 @@ class TestAsyncSetupEntry:
         # 22 base sensors + 7 for the previous period
         assert len(sensors) == 22 + 7
 
-    @pytest.mark.asyncio
     async def test_creates_multiple_previous_period_sensors(self):
         """With 2 previous periods, verify additional sensors are created (7 per period)."""
         coord = _make_coordinator()
@@ -1306,7 +1302,6 @@ class TestAsyncSetupEntry:
         sensors = async_add_entities.call_args[0][0]
         assert len(sensors) == 22 + 14
 
-    @pytest.mark.asyncio
     async def test_sensor_types_present(self):
         """Verify that each expected sensor type is present."""
         coord = _make_coordinator()